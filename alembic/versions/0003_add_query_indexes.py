@@ -0,0 +1,45 @@
+"""add indexes for usuario listing and username reference lookups
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+# Columnas que guardan el username y se filtran por igualdad
+# (cascada de cambio de username y filtros por propietario/veterinario)
+USERNAME_REFERENCE_INDEXES = [
+    ('ix_mascotas_propietario', 'mascotas', 'propietario'),
+    ('ix_citas_veterinario', 'citas', 'veterinario'),
+    ('ix_vacunas_veterinario', 'vacunas', 'veterinario'),
+    ('ix_facturas_veterinario', 'facturas', 'veterinario'),
+    ('ix_recetas_veterinario', 'recetas', 'veterinario'),
+]
+
+
+def upgrade() -> None:
+    # Listado de usuarios: WHERE role = ? AND is_deleted = 0 ORDER BY username
+    op.create_index(
+        'ix_usuarios_role_deleted_username',
+        'usuarios',
+        ['role', 'is_deleted', 'username'],
+    )
+    
+    for index_name, table, column in USERNAME_REFERENCE_INDEXES:
+        op.create_index(index_name, table, [column])
+
+
+def downgrade() -> None:
+    for index_name, table, _ in reversed(USERNAME_REFERENCE_INDEXES):
+        op.drop_index(index_name, table_name=table)
+    
+    op.drop_index('ix_usuarios_role_deleted_username', table_name='usuarios')
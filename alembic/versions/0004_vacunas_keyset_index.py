@@ -0,0 +1,28 @@
+"""add index for keyset pagination of vacunas
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Listado de vacunas por cursor: ORDER BY fecha_aplicacion DESC, id_vacuna DESC
+    op.create_index(
+        'ix_vacunas_fecha_aplicacion_id',
+        'vacunas',
+        ['fecha_aplicacion', 'id_vacuna'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vacunas_fecha_aplicacion_id', table_name='vacunas')
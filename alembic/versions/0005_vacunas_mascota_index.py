@@ -0,0 +1,29 @@
+"""add index on vacunas.id_mascota for the propietario join
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # vacunas JOIN mascotas ON id_mascota (filtro por propietario para clientes)
+    # y WHERE id_mascota = ? ORDER BY fecha_aplicacion DESC (historial)
+    op.create_index(
+        'ix_vacunas_mascota_fecha',
+        'vacunas',
+        ['id_mascota', 'fecha_aplicacion'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vacunas_mascota_fecha', table_name='vacunas')
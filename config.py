@@ -80,6 +80,11 @@ class Settings(BaseSettings):
         le=500,
         description="Tamaño máximo de página permitido"
     )
+    simple_pagination_threshold: int = Field(
+        default=10_000,
+        ge=1,
+        description="Tope del conteo total en listados grandes (por encima se informa como estimado)"
+    )
     
     # Logging
     log_level: str = Field(
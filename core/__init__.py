@@ -36,6 +36,7 @@ from .utils import (
     enum_to_value,
     normalize_stored_enum,
     uuid_to_str,
+    uuid7,
 )
 
 __all__ = [
@@ -64,4 +65,5 @@ __all__ = [
     "enum_to_value",
     "normalize_stored_enum",
     "uuid_to_str",
+    "uuid7",
 ]
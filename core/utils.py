@@ -2,6 +2,10 @@
 Funciones de utilidad generales.
 """
 
+import os
+import threading
+import time
+from functools import lru_cache
 from typing import Optional, Any
 from enum import Enum as PyEnum
 from uuid import UUID
@@ -22,12 +26,15 @@ def enum_to_value(value: Any) -> Any:
     return value
 
 
+@lru_cache(maxsize=64)
 def normalize_stored_enum(value: str) -> str:
     """
     Normaliza los valores de enum almacenados en la base de datos.
     
     La base de datos puede almacenar valores de enum como nombres completos (por ejemplo, "TipoMascota.perro").
     Este ayudante devuelve el nombre corto después del punto ("perro").
+    Se llama una vez por fila en los listados sobre un conjunto pequeño de
+    valores, por eso se memoiza.
     
     Args:
         value: Valor de enum almacenado en la base de datos
@@ -57,3 +64,47 @@ def uuid_to_str(value: Any) -> Optional[str]:
     if isinstance(value, UUID):
         return str(value)
     return str(value)
+
+
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def uuid7() -> UUID:
+    """
+    Genera un UUID versión 7 (RFC 9562) ordenado por tiempo.
+    
+    Los primeros 48 bits son el timestamp Unix en milisegundos, por lo que
+    los ids generados son crecientes tanto como UUID como en su forma de
+    cadena. Dentro del mismo milisegundo se usa un contador de 12 bits
+    (rand_a) para mantener el orden monotónico.
+    
+    Returns:
+        UUID versión 7
+    """
+    global _uuid7_last_ms, _uuid7_counter
+    
+    with _uuid7_lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _uuid7_last_ms:
+            _uuid7_last_ms = timestamp_ms
+            _uuid7_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Mismo milisegundo (o reloj hacia atrás): avanzar el contador
+            _uuid7_counter += 1
+            if _uuid7_counter > 0xFFF:
+                _uuid7_last_ms += 1
+                _uuid7_counter = 0
+            timestamp_ms = _uuid7_last_ms
+        counter = _uuid7_counter
+    
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return UUID(int=value)
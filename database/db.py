@@ -3,6 +3,7 @@ from typing import Optional, Generator
 from datetime import datetime
 from uuid import uuid4, UUID
 import hashlib
+import hmac
 import logging
 import os
 
@@ -142,18 +143,23 @@ def ensure_usuario_exists(user_id: Optional[str]) -> bool:
                 pass
 
 
+# iteraciones de PBKDF2; se leen en cada llamada (los tests las reducen)
+PBKDF2_ITERATIONS = 100_000
+
+
 def hash_password(password: str) -> tuple[str, str]:
     """Genera salt y hash (ambos hex) usando PBKDF2-HMAC-SHA256."""
     salt = os.urandom(16)
-    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100_000)
+    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, PBKDF2_ITERATIONS)
     return salt.hex(), dk.hex()
 
 
 def verify_password(salt_hex: str, hash_hex: str, password: str) -> bool:
     """Verifica que password coincida con salt+hash almacenados."""
     salt = bytes.fromhex(salt_hex)
-    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100_000)
-    return dk.hex() == hash_hex
+    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, PBKDF2_ITERATIONS)
+    # comparación en tiempo constante (evita filtrar el hash por tiempos)
+    return hmac.compare_digest(dk.hex(), hash_hex)
 
 
 def set_audit_fields(obj, user_id: Optional[str], creating: bool = True) -> None:
@@ -1,15 +1,17 @@
 from typing import Optional
 from datetime import datetime
-from uuid import uuid4, UUID
+from uuid import UUID
 
-from sqlalchemy import Column, String, Integer, DateTime, Float, Text, ForeignKey, Date, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, Float, Text, ForeignKey, Date, Boolean, Index
 from sqlalchemy.orm import declarative_base, relationship
 
+from core.utils import uuid7
+
 Base = declarative_base()
 
 
 def gen_uuid_str():
-    return str(uuid4())
+    return str(uuid7())
 
 
 def get_current_time():
@@ -44,6 +46,11 @@ class UsuarioORM(Base):
     deleted_at = Column(DateTime, nullable=True)
     deleted_by = Column(String(36), nullable=True)
 
+    __table_args__ = (
+        #listado de usuarios: filtro por rol/is_deleted, orden por username
+        Index("ix_usuarios_role_deleted_username", "role", "is_deleted", "username"),
+    )
+
 
 #ORM: Mascotas
 class MascotaORM(Base):
@@ -54,7 +61,7 @@ class MascotaORM(Base):
     raza = Column(String(50))
     edad = Column(Integer)
     peso = Column(Float)
-    propietario = Column(String(100))  # username, validated at insert time
+    propietario = Column(String(100), index=True)  # username, validated at insert time
     #auditoría
     id_usuario_creacion = Column(String(36), nullable=True)
     id_usuario_actualizacion = Column(String(36), nullable=True)
@@ -73,7 +80,7 @@ class CitaORM(Base):
     id_mascota = Column(String(36), ForeignKey("mascotas.id_mascota"), nullable=False)
     fecha = Column(DateTime, nullable=False)
     motivo = Column(String(200))
-    veterinario = Column(String(100))
+    veterinario = Column(String(100), index=True)
     estado = Column(String(20), default="pendiente")
     diagnostico = Column(String(500), nullable=True)
     tratamiento = Column(String(500), nullable=True)
@@ -95,7 +102,7 @@ class VacunaORM(Base):
     id_mascota = Column(String(36), ForeignKey("mascotas.id_mascota"), nullable=False)
     tipo_vacuna = Column(String(50))
     fecha_aplicacion = Column(Date)
-    veterinario = Column(String(100))
+    veterinario = Column(String(100), index=True)
     lote_vacuna = Column(String(20))
     proxima_dosis = Column(Date, nullable=True)
     #auditoría
@@ -108,6 +115,13 @@ class VacunaORM(Base):
     deleted_at = Column(DateTime, nullable=True)
     deleted_by = Column(String(36), nullable=True)
 
+    __table_args__ = (
+        #paginación por cursor: ORDER BY fecha_aplicacion DESC, id_vacuna DESC
+        Index("ix_vacunas_fecha_aplicacion_id", "fecha_aplicacion", "id_vacuna"),
+        #join con mascotas (filtro por propietario) e historial por mascota
+        Index("ix_vacunas_mascota_fecha", "id_mascota", "fecha_aplicacion"),
+    )
+
 
 #ORM: Facturas
 class FacturaORM(Base):
@@ -120,7 +134,7 @@ class FacturaORM(Base):
     fecha_factura = Column(DateTime, nullable=False)
     tipo_servicio = Column(String(50))
     descripcion = Column(Text)
-    veterinario = Column(String(100))
+    veterinario = Column(String(100), index=True)
     valor_servicio = Column(Float)
     iva = Column(Float)
     descuento = Column(Float)
@@ -143,7 +157,7 @@ class RecetaORM(Base):
     id = Column("id_receta", String(36), primary_key=True, default=gen_uuid_str)
     id_cita = Column(String(36), ForeignKey("citas.id_cita"), nullable=False)
     fecha_emision = Column(DateTime, nullable=False)
-    veterinario = Column(String(100))
+    veterinario = Column(String(100), index=True)
     indicaciones = Column(Text)
     #auditoría
     id_usuario_creacion = Column(String(36), nullable=True)
@@ -167,6 +167,33 @@ class BaseRepository(Generic[T]):
             self.db.rollback()
             raise DatabaseException(f"Error al crear {self.model_class.__name__}")
     
+    def create_many(self, entities: List[T], user_id: Optional[str] = None) -> List[T]:
+        """
+        Crea varias entidades con un solo flush.
+        
+        A diferencia de create, no refresca cada entidad: el flush agrupa
+        los INSERT de la misma tabla en un executemany.
+        
+        Args:
+            entities: Las entidades a crear
+            user_id: ID del usuario que crea las entidades (para auditoría)
+            
+        Returns:
+            The created entities
+        """
+        try:
+            if user_id:
+                for entity in entities:
+                    set_audit_fields(entity, user_id, creating=True)
+            
+            self.db.add_all(entities)
+            self.db.flush()
+            return entities
+        except Exception as e:
+            logger.error(f"Error creating {self.model_class.__name__} batch: {e}")
+            self.db.rollback()
+            raise DatabaseException(f"Error al crear {self.model_class.__name__}")
+    
     def update(self, entity: T, user_id: Optional[str] = None) -> T:
         """
         Actualiza una entidad existente.
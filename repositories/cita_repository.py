@@ -3,7 +3,7 @@ Repositorio para la entidad Cita.
 Gestiona todas las operaciones de base de datos relacionadas con las citas (preguntas).
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_
@@ -253,3 +253,28 @@ class CitaRepository(BaseRepository[CitaORM]):
         except Exception as e:
             logger.error(f"Error counting citas by filters: {e}")
             raise DatabaseException("Error al contar citas")
+    
+    def get_by_ids(self, ids: Iterable[str]) -> Dict[str, CitaORM]:
+        """
+        Obtiene varias citas por ID en una sola consulta.
+        
+        Incluye citas eliminadas lógicamente, igual que get_by_id.
+        
+        Args:
+            ids: IDs de las citas
+            
+        Returns:
+            Diccionario id -> cita (los IDs inexistentes no aparecen)
+        """
+        ids = {str(cita_id) for cita_id in ids}
+        if not ids:
+            return {}
+        
+        try:
+            citas = self.db.query(CitaORM).filter(
+                CitaORM.id.in_(ids)
+            ).all()
+            return {cita.id: cita for cita in citas}
+        except Exception as e:
+            logger.error(f"Error getting citas by ids: {e}")
+            raise DatabaseException("Error al obtener citas")
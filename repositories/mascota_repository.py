@@ -3,7 +3,7 @@ Repositorio para la entidad Mascota.
 Gestiona todas las operaciones de base de datos relacionadas con mascotas.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
 
@@ -313,3 +313,28 @@ class MascotaRepository(BaseRepository[MascotaORM]):
         except Exception as e:
             logger.error(f"Error searching mascotas with term '{search_term}': {e}")
             raise DatabaseException("Error al buscar mascotas")
+    
+    def get_by_ids(self, ids: Iterable[str]) -> Dict[str, MascotaORM]:
+        """
+        Obtiene varias mascotas por ID en una sola consulta.
+        
+        Incluye mascotas eliminadas lógicamente, igual que get_by_id.
+        
+        Args:
+            ids: IDs de las mascotas
+            
+        Returns:
+            Diccionario id -> mascota (los IDs inexistentes no aparecen)
+        """
+        ids = {str(mascota_id) for mascota_id in ids}
+        if not ids:
+            return {}
+        
+        try:
+            mascotas = self.db.query(MascotaORM).filter(
+                MascotaORM.id.in_(ids)
+            ).all()
+            return {mascota.id: mascota for mascota in mascotas}
+        except Exception as e:
+            logger.error(f"Error getting mascotas by ids: {e}")
+            raise DatabaseException("Error al obtener mascotas")
@@ -4,7 +4,7 @@ Gestiona todas las operaciones de base de datos relacionadas con las recetas (pr
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from repositories.base_repository import BaseRepository
 from database.models import RecetaORM, RecetaLineaORM, CitaORM, MascotaORM
@@ -86,7 +86,8 @@ class RecetaRepository(BaseRepository[RecetaORM]):
             List of recetas (without lineas)
         """
         try:
-            query = self.db.query(RecetaORM).filter(
+            # Listados: ninguna relación debe cargarse fila a fila (N+1)
+            query = self.db.query(RecetaORM).options(raiseload("*")).filter(
                 RecetaORM.veterinario.ilike(f"%{veterinario}%")
             )
             
@@ -120,7 +121,8 @@ class RecetaRepository(BaseRepository[RecetaORM]):
             List of recetas (without lineas)
         """
         try:
-            query = self.db.query(RecetaORM).join(
+            # Listados: ninguna relación debe cargarse fila a fila (N+1)
+            query = self.db.query(RecetaORM).options(raiseload("*")).join(
                 CitaORM, RecetaORM.id_cita == CitaORM.id
             ).join(
                 MascotaORM, CitaORM.id_mascota == MascotaORM.id
@@ -158,7 +160,8 @@ class RecetaRepository(BaseRepository[RecetaORM]):
             List de recetas (sin lineas)
         """
         try:
-            query = self.db.query(RecetaORM).join(
+            # Listados: ninguna relación debe cargarse fila a fila (N+1)
+            query = self.db.query(RecetaORM).options(raiseload("*")).join(
                 CitaORM, RecetaORM.id_cita == CitaORM.id
             ).filter(
                 CitaORM.id_mascota == mascota_id
@@ -196,7 +199,8 @@ class RecetaRepository(BaseRepository[RecetaORM]):
         try:
             from sqlalchemy import or_
             
-            query = self.db.query(RecetaORM).join(
+            # Listados: ninguna relación debe cargarse fila a fila (N+1)
+            query = self.db.query(RecetaORM).options(raiseload("*")).join(
                 CitaORM, RecetaORM.id_cita == CitaORM.id
             ).join(
                 MascotaORM, CitaORM.id_mascota == MascotaORM.id
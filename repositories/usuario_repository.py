@@ -3,17 +3,63 @@ Repositorio para la entidad Usuario.
 Gestiona todas las operaciones de base de datos relacionadas con los usuarios.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update, bindparam
 
 from repositories.base_repository import BaseRepository
-from database.models import UsuarioORM
+from database.models import (
+    UsuarioORM,
+    MascotaORM,
+    CitaORM,
+    VacunaORM,
+    FacturaORM,
+    RecetaORM,
+)
 from core.exceptions import DatabaseException
+from utils.datetime_utils import get_local_now
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Sentencias de forma fija construidas una sola vez al importar el módulo.
+# SQLAlchemy reutiliza su forma compilada (caché de compilación del engine)
+# y solo cambian los parámetros enlazados en cada ejecución.
+_EXISTS_USERNAME = (
+    select(UsuarioORM.id)
+    .where(UsuarioORM.username == bindparam("username"))
+    .limit(1)
+)
+
+_EXISTS_USERNAME_EXCLUDING_ID = (
+    select(UsuarioORM.id)
+    .where(
+        UsuarioORM.username == bindparam("username"),
+        UsuarioORM.id != bindparam("exclude_id"),
+    )
+    .limit(1)
+)
+
+# Columnas que guardan el username como referencia (actualización en cascada)
+_USERNAME_REFERENCES = (
+    ("mascotas", MascotaORM.propietario),
+    ("citas", CitaORM.veterinario),
+    ("vacunas", VacunaORM.veterinario),
+    ("facturas", FacturaORM.veterinario),
+    ("recetas", RecetaORM.veterinario),
+)
+
+_CASCADE_RENAME = tuple(
+    (
+        label,
+        update(column.class_)
+        .where(column == bindparam("old_username"))
+        .values({column: bindparam("new_username")})
+        .execution_options(synchronize_session=False),
+    )
+    for label, column in _USERNAME_REFERENCES
+)
+
 
 class UsuarioRepository(BaseRepository[UsuarioORM]):
     """Repositorio para la gestión de entidades de usuario."""
@@ -45,6 +91,29 @@ class UsuarioRepository(BaseRepository[UsuarioORM]):
             logger.error(f"Error finding usuario by username {username}: {e}")
             raise DatabaseException("Error al buscar usuario por username")
     
+    def get_by_usernames(self, usernames: Iterable[str]) -> Dict[str, UsuarioORM]:
+        """
+        Busca varios usuarios por username en una sola consulta.
+        
+        Args:
+            usernames: Usernames a buscar
+            
+        Returns:
+            Diccionario username -> usuario (los inexistentes no aparecen)
+        """
+        usernames = {username for username in usernames if username}
+        if not usernames:
+            return {}
+        
+        try:
+            usuarios = self.db.query(UsuarioORM).filter(
+                UsuarioORM.username.in_(usernames)
+            ).all()
+            return {usuario.username: usuario for usuario in usuarios}
+        except Exception as e:
+            logger.error(f"Error finding usuarios by usernames: {e}")
+            raise DatabaseException("Error al buscar usuarios por username")
+    
     def find_by_role(
         self,
         role: str,
@@ -79,6 +148,44 @@ class UsuarioRepository(BaseRepository[UsuarioORM]):
             logger.error(f"Error finding usuarios by role {role}: {e}")
             raise DatabaseException("Error al buscar usuarios por rol")
     
+    def iter_all(
+        self,
+        role: Optional[str] = None,
+        include_deleted: bool = False,
+        batch_size: int = 500
+    ) -> Iterator[UsuarioORM]:
+        """
+        Itera sobre los usuarios por lotes, sin materializar toda la lista.
+        
+        La consulta se ejecuta de inmediato (los errores se reportan aquí) y
+        las filas se hidratan de a batch_size usando un cursor del lado del
+        servidor.
+        
+        Args:
+            role: Rol a filtrar (opcional)
+            include_deleted: Si se deben incluir los registros eliminados temporalmente
+            batch_size: Número de filas a traer por lote
+            
+        Returns:
+            Iterador de usuarios ordenados por username
+        """
+        try:
+            stmt = select(UsuarioORM)
+            
+            if role:
+                stmt = stmt.where(UsuarioORM.role == role)
+            if not include_deleted:
+                stmt = stmt.where(UsuarioORM.is_deleted == False)
+            
+            stmt = stmt.order_by(UsuarioORM.username).execution_options(
+                yield_per=batch_size
+            )
+            
+            return iter(self.db.scalars(stmt))
+        except Exception as e:
+            logger.error(f"Error iterating usuarios: {e}")
+            raise DatabaseException("Error al recorrer usuarios")
+    
     def count_by_role(
         self,
         role: str,
@@ -123,14 +230,15 @@ class UsuarioRepository(BaseRepository[UsuarioORM]):
             True si el username existe, False en caso contrario
         """
         try:
-            query = self.db.query(UsuarioORM).filter(
-                UsuarioORM.username == username
-            )
-            
             if exclude_id:
-                query = query.filter(UsuarioORM.id != exclude_id)
+                result = self.db.execute(
+                    _EXISTS_USERNAME_EXCLUDING_ID,
+                    {"username": username, "exclude_id": str(exclude_id)}
+                )
+            else:
+                result = self.db.execute(_EXISTS_USERNAME, {"username": username})
             
-            return query.first() is not None
+            return result.first() is not None
         except Exception as e:
             logger.error(f"Error checking if username exists {username}: {e}")
             raise DatabaseException("Error al verificar username")
@@ -168,3 +276,77 @@ class UsuarioRepository(BaseRepository[UsuarioORM]):
         except Exception as e:
             logger.error(f"Error searching usuarios by nombre {nombre}: {e}")
             raise DatabaseException("Error al buscar usuarios por nombre")
+    
+    def update_returning(
+        self,
+        usuario_id: str,
+        values: Dict[str, Any],
+        user_id: Optional[str] = None
+    ) -> Optional[UsuarioORM]:
+        """
+        Actualiza un usuario activo con un solo UPDATE ... RETURNING.
+        
+        Evita el SELECT previo: el UPDATE filtra por id y is_deleted, y la
+        fila actualizada vuelve en la misma sentencia. Los campos de
+        auditoría se setean igual que en update().
+        
+        Args:
+            usuario_id: ID del usuario a actualizar
+            values: Valores a asignar (nombre de atributo -> valor)
+            user_id: ID del usuario que realiza la actualización (auditoría)
+            
+        Returns:
+            Usuario actualizado, o None si no existe o está eliminado
+        """
+        try:
+            values = dict(values)
+            if user_id:
+                values["id_usuario_actualizacion"] = user_id
+            values["fecha_actualizacion"] = get_local_now().replace(tzinfo=None)
+            
+            stmt = (
+                update(UsuarioORM)
+                .where(
+                    UsuarioORM.id == str(usuario_id),
+                    UsuarioORM.is_deleted == False,
+                )
+                .values(**values)
+                .returning(UsuarioORM)
+                .execution_options(synchronize_session="fetch")
+            )
+            return self.db.scalars(stmt).one_or_none()
+        except Exception as e:
+            logger.error(f"Error updating usuario {usuario_id}: {e}")
+            self.db.rollback()
+            raise DatabaseException("Error al actualizar UsuarioORM")
+    
+    def update_username_references(
+        self,
+        old_username: str,
+        new_username: str
+    ) -> Dict[str, int]:
+        """
+        Actualiza en cascada las referencias por username en las tablas relacionadas.
+        
+        Las sentencias se ejecutan en secuencia sobre la conexión de la sesión:
+        deben formar parte de la misma transacción que el cambio de username y
+        una sesión (síncrona o asíncrona) no admite ejecuciones concurrentes.
+        
+        Args:
+            old_username: Username a reemplazar
+            new_username: Nuevo username
+            
+        Returns:
+            Diccionario tabla -> cantidad de filas actualizadas
+        """
+        try:
+            params = {"old_username": old_username, "new_username": new_username}
+            updated = {
+                label: self.db.execute(stmt, params).rowcount
+                for label, stmt in _CASCADE_RENAME
+            }
+            self.db.flush()
+            return updated
+        except Exception as e:
+            logger.error(f"Error updating username references {old_username}: {e}")
+            raise DatabaseException("Error al actualizar referencias del usuario")
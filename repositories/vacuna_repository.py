@@ -2,9 +2,10 @@
 Repositorio para la entidad Vacuna.
 Gestiona todas las operaciones de base de datos relacionadas con vacunas.
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import func, and_, or_
 
 from repositories.base_repository import BaseRepository
 from database.models import VacunaORM, MascotaORM
@@ -46,20 +47,53 @@ class VacunaRepository(BaseRepository[VacunaORM]):
             Lista de vacunas
         """
         try:
-            query = self.db.query(VacunaORM).filter(
+            # Listados: ninguna relación debe cargarse fila a fila (N+1)
+            query = self.db.query(VacunaORM).options(raiseload("*")).filter(
                 VacunaORM.id_mascota == id_mascota
             )
             
             if not include_deleted:
                 query = query.filter(VacunaORM.is_deleted == False)
             
-            query = query.order_by(VacunaORM.fecha_aplicacion.desc())
+            # Mismo orden que find_by_multiple_filters (válido para el cursor)
+            query = query.order_by(
+                VacunaORM.fecha_aplicacion.desc(),
+                VacunaORM.id.desc()
+            )
             
             return query.offset(skip).limit(limit).all()
         except Exception as e:
             logger.error(f"Error finding vacunas by mascota {id_mascota}: {e}")
             raise DatabaseException("Error al buscar vacunas por mascota")
     
+    def count_by_mascota(
+        self,
+        id_mascota: str,
+        include_deleted: bool = False
+    ) -> int:
+        """
+        Cuenta las vacunas de una mascota específica.
+        
+        Args:
+            id_mascota: ID de la mascota
+            include_deleted: Si se deben incluir los registros eliminados temporalmente
+            
+        Returns:
+            Cantidad de vacunas de la mascota
+        """
+        try:
+            query = self.db.query(func.count(VacunaORM.id)).filter(
+                VacunaORM.id_mascota == id_mascota
+            )
+            
+            if not include_deleted:
+                query = query.filter(VacunaORM.is_deleted == False)
+            
+            return query.scalar()
+        except Exception as e:
+            logger.error(f"Error counting vacunas by mascota {id_mascota}: {e}")
+            raise DatabaseException("Error al contar vacunas por mascota")
+    
     def find_by_veterinario(
         self,
         veterinario: str,
@@ -132,7 +166,8 @@ class VacunaRepository(BaseRepository[VacunaORM]):
         self,
         fecha_limite: Optional[date] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        propietario_username: Optional[str] = None
     ) -> List[VacunaORM]:
         """
         Busca vacunas con próximas dosis pendientes.
@@ -141,6 +176,7 @@ class VacunaRepository(BaseRepository[VacunaORM]):
             fecha_limite: Fecha límite opcional (por defecto None - todas las dosis futuras)
             skip: Número de registros a omitir
             limit: Número máximo de registros a devolver
+            propietario_username: Solo vacunas de mascotas de este propietario
             
         Returns:
             Lista de vacunas con próximas dosis
@@ -153,6 +189,12 @@ class VacunaRepository(BaseRepository[VacunaORM]):
                 VacunaORM.is_deleted == False
             )
             
+            #Filtro por propietario en SQL, antes del LIMIT
+            if propietario_username:
+                query = query.join(
+                    MascotaORM, VacunaORM.id_mascota == MascotaORM.id
+                ).filter(MascotaORM.propietario == propietario_username)
+            
             if fecha_limite:
                 query = query.filter(VacunaORM.proxima_dosis <= fecha_limite)
             
@@ -219,8 +261,6 @@ class VacunaRepository(BaseRepository[VacunaORM]):
             Lista de vacunas
         """
         try:
-            from sqlalchemy import or_
-            
             query = self.db.query(VacunaORM).join(
                 MascotaORM, VacunaORM.id_mascota == MascotaORM.id
             ).filter(
@@ -240,6 +280,57 @@ class VacunaRepository(BaseRepository[VacunaORM]):
             logger.error(f"Error finding vacunas by veterinario or propietario {username}: {e}")
             raise DatabaseException("Error al buscar vacunas")
     
+    def _apply_filters(
+        self,
+        query,
+        tipo_vacuna: Optional[str] = None,
+        veterinario: Optional[str] = None,
+        id_mascota: Optional[str] = None,
+        propietario_username: Optional[str] = None,
+        search_term: Optional[str] = None,
+        include_deleted: bool = False
+    ):
+        """
+        Aplica los filtros del listado de vacunas (lógica AND) a una consulta.
+        
+        Hace join con MascotaORM solo si se filtra por datos de la mascota.
+        
+        Returns:
+            La consulta filtrada
+        """
+        #Join with MascotaORM if we need to filter/search by mascota data
+        if propietario_username or search_term:
+            query = query.join(
+                MascotaORM, VacunaORM.id_mascota == MascotaORM.id
+            )
+        
+        if tipo_vacuna:
+            query = query.filter(VacunaORM.tipo_vacuna == tipo_vacuna)
+        
+        if veterinario:
+            query = query.filter(VacunaORM.veterinario.ilike(f"%{veterinario}%"))
+        
+        if id_mascota:
+            query = query.filter(VacunaORM.id_mascota == id_mascota)
+        
+        #Filtro exacto por propietario (para clientes)
+        if propietario_username:
+            query = query.filter(MascotaORM.propietario == propietario_username)
+        
+        #Búsqueda libre: nombre de mascota OR nombre de propietario
+        if search_term:
+            query = query.filter(
+                or_(
+                    MascotaORM.nombre.ilike(f"%{search_term}%"),
+                    MascotaORM.propietario.ilike(f"%{search_term}%")
+                )
+            )
+        
+        if not include_deleted:
+            query = query.filter(VacunaORM.is_deleted == False)
+        
+        return query
+    
     def find_by_multiple_filters(
         self,
         tipo_vacuna: Optional[str] = None,
@@ -249,12 +340,17 @@ class VacunaRepository(BaseRepository[VacunaORM]):
         search_term: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        cursor: Optional[Tuple[date, str]] = None
     ) -> List[VacunaORM]:
         """
         Busca vacunas que coincidan con múltiples filtros con paginación.
         Los filtros se combinan con lógica AND.
         
+        Con cursor se usa paginación por clave (keyset): se devuelven las
+        vacunas posteriores a (fecha_aplicacion, id) en el orden del listado
+        y se ignora skip, así el costo no crece con el número de página.
+        
         Args:
             tipo_vacuna: Optional tipo_vacuna filter
             veterinario: Optional veterinario filter
@@ -264,48 +360,45 @@ class VacunaRepository(BaseRepository[VacunaORM]):
             skip: Número de registros a omitir
             limit: Número máximo de registros a devolver
             include_deleted: Si se deben incluir los registros eliminados temporalmente
+            cursor: (fecha_aplicacion, id) de la última vacuna de la página anterior
             
         Returns:
             Lista de vacunas
         """
         try:
-            query = self.db.query(VacunaORM)
-            
-            #Join with MascotaORM if we need to filter/search by mascota data
-            if propietario_username or search_term:
-                query = query.join(
-                    MascotaORM, VacunaORM.id_mascota == MascotaORM.id
-                )
-            
-            if tipo_vacuna:
-                query = query.filter(VacunaORM.tipo_vacuna == tipo_vacuna)
-            
-            if veterinario:
-                query = query.filter(VacunaORM.veterinario.ilike(f"%{veterinario}%"))
-            
-            if id_mascota:
-                query = query.filter(VacunaORM.id_mascota == id_mascota)
-            
-            #Filtro exacto por propietario (para clientes)
-            if propietario_username:
-                query = query.filter(MascotaORM.propietario == propietario_username)
+            # Listados: ninguna relación debe cargarse fila a fila (N+1)
+            query = self._apply_filters(
+                self.db.query(VacunaORM).options(raiseload("*")),
+                tipo_vacuna=tipo_vacuna,
+                veterinario=veterinario,
+                id_mascota=id_mascota,
+                propietario_username=propietario_username,
+                search_term=search_term,
+                include_deleted=include_deleted
+            )
             
-            #Búsqueda libre: nombre de mascota OR nombre de propietario
-            if search_term:
-                from sqlalchemy import or_
+            #Keyset: equivalente a (fecha, id) < cursor, sin comparación de tuplas
+            #porque SQL Server no la soporta
+            if cursor:
+                after_fecha, after_id = cursor
                 query = query.filter(
                     or_(
-                        MascotaORM.nombre.ilike(f"%{search_term}%"),
-                        MascotaORM.propietario.ilike(f"%{search_term}%")
+                        VacunaORM.fecha_aplicacion < after_fecha,
+                        and_(
+                            VacunaORM.fecha_aplicacion == after_fecha,
+                            VacunaORM.id < after_id
+                        )
                     )
                 )
             
-            if not include_deleted:
-                query = query.filter(VacunaORM.is_deleted == False)
-            
-            #Order by fecha_aplicacion descending (most recent first)
-            query = query.order_by(VacunaORM.fecha_aplicacion.desc())
+            #Order by fecha_aplicacion descending (most recent first), id as tiebreaker
+            query = query.order_by(
+                VacunaORM.fecha_aplicacion.desc(),
+                VacunaORM.id.desc()
+            )
             
+            if cursor:
+                return query.limit(limit).all()
             return query.offset(skip).limit(limit).all()
         except Exception as e:
             logger.error(f"Error finding vacunas by multiple filters: {e}")
@@ -335,40 +428,61 @@ class VacunaRepository(BaseRepository[VacunaORM]):
             Cantidad de vacunas que coinciden con los filtros
         """
         try:
-            query = self.db.query(VacunaORM)
-            
-            #join with mascota if needed
-            if propietario_username or search_term:
-                query = query.join(
-                    MascotaORM, VacunaORM.id_mascota == MascotaORM.id
-                )
-            
-            if tipo_vacuna:
-                query = query.filter(VacunaORM.tipo_vacuna == tipo_vacuna)
-            
-            if veterinario:
-                query = query.filter(VacunaORM.veterinario.ilike(f"%{veterinario}%"))
-            
-            if id_mascota:
-                query = query.filter(VacunaORM.id_mascota == id_mascota)
-            
-            if propietario_username:
-                query = query.filter(MascotaORM.propietario == propietario_username)
-            
-            #busqueda libre
-            if search_term:
-                from sqlalchemy import or_
-                query = query.filter(
-                    or_(
-                        MascotaORM.nombre.ilike(f"%{search_term}%"),
-                        MascotaORM.propietario.ilike(f"%{search_term}%")
-                    )
-                )
-            
-            if not include_deleted:
-                query = query.filter(VacunaORM.is_deleted == False)
-            
-            return query.count()
+            return self._apply_filters(
+                self.db.query(VacunaORM),
+                tipo_vacuna=tipo_vacuna,
+                veterinario=veterinario,
+                id_mascota=id_mascota,
+                propietario_username=propietario_username,
+                search_term=search_term,
+                include_deleted=include_deleted
+            ).count()
         except Exception as e:
             logger.error(f"Error counting vacunas by filters: {e}")
             raise DatabaseException("Error al contar vacunas")
+    
+    def count_by_filters_capped(
+        self,
+        cap: int,
+        tipo_vacuna: Optional[str] = None,
+        veterinario: Optional[str] = None,
+        id_mascota: Optional[str] = None,
+        propietario_username: Optional[str] = None,
+        search_term: Optional[str] = None,
+        include_deleted: bool = False
+    ) -> int:
+        """
+        Cuenta las vacunas que coinciden con los filtros, hasta un máximo.
+        
+        Equivale a SELECT COUNT(*) FROM (SELECT TOP :cap ... ) sub: la base de
+        datos deja de recorrer filas al llegar al tope, así que en tablas
+        grandes el costo queda acotado. Un resultado igual a cap significa
+        "cap o más".
+        
+        Args:
+            cap: Máximo de filas a contar
+            tipo_vacuna: Optional tipo_vacuna filter
+            veterinario: Optional veterinario filter
+            id_mascota: Optional mascota ID filter
+            propietario_username: Optional propietario filter (exact match on username)
+            search_term: Optional search in mascota nombre OR propietario nombre
+            include_deleted: Si se deben incluir los registros eliminados temporalmente
+            
+        Returns:
+            Cantidad de vacunas que coinciden, como máximo cap
+        """
+        try:
+            subquery = self._apply_filters(
+                self.db.query(VacunaORM.id),
+                tipo_vacuna=tipo_vacuna,
+                veterinario=veterinario,
+                id_mascota=id_mascota,
+                propietario_username=propietario_username,
+                search_term=search_term,
+                include_deleted=include_deleted
+            ).limit(cap).subquery()
+            
+            return self.db.query(func.count()).select_from(subquery).scalar()
+        except Exception as e:
+            logger.error(f"Error counting vacunas by filters (capped): {e}")
+            raise DatabaseException("Error al contar vacunas")
@@ -6,10 +6,13 @@ All business logic is delegated to the UsuarioService layer.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import Optional
 from datetime import datetime
 import logging
 
+import orjson
+
 from models.usuarios import (
     Usuario,
     UsuarioCreate,
@@ -30,7 +33,7 @@ from core.exceptions import (
     DuplicateException,
 )
 from services.usuario_service import UsuarioService
-from database.db import get_db
+from database.db import get_db, SessionLocal
 from sqlalchemy.orm import Session
 from auth import get_current_user_dep, require_roles
 from config import settings
@@ -178,7 +181,7 @@ async def crear_usuario_privilegiado(
         )
 
 
-@router.get("/")
+@router.get("/", response_class=ORJSONResponse)
 async def listar_usuarios(
     page: int = Query(0, ge=0, description="Número de página (0-indexed)"),
     page_size: int = Query(
@@ -216,7 +219,10 @@ async def listar_usuarios(
             role=role_str,
             include_deleted=include_deleted
         )
-        return create_paginated_response(items, page, page_size, total)
+        # orjson serializa directamente los datetime de _to_response_dict
+        return ORJSONResponse(
+            create_paginated_response(items, page, page_size, total)
+        )
     except AppException as e:
         raise handle_service_exception(e)
     except Exception as e:
@@ -269,6 +275,67 @@ async def listar_veterinarios(
         )
 
 
+@router.get("/export")
+async def exportar_usuarios(
+    role: Optional[Role] = Query(None, description="Filtrar por rol"),
+    include_deleted: bool = Query(False, description="Incluir usuarios eliminados"),
+    current_user=Depends(require_roles("admin")),
+):
+    """
+    Export all usuarios as NDJSON (ADMIN ONLY).
+    
+    Rows are streamed one JSON object per line, read from the database in
+    batches, so large exports do not need the whole list in memory.
+    
+    The body is sent after the handler returns, so the export uses its own
+    session instead of the request-scoped one from get_db; it is closed when
+    the stream ends. If the database fails once streaming has started, the
+    status code is already sent: the error is logged and the body ends with
+    an {"error": ...} line so clients can tell the export is incomplete.
+    
+    Args:
+        role: Optional role filter
+        include_deleted: Include soft-deleted usuarios
+        current_user: Current authenticated admin user
+        
+    Returns:
+        Streaming NDJSON response
+    """
+    from repositories.usuario_repository import UsuarioRepository
+    
+    db = SessionLocal()
+    try:
+        role_str = role.value if role else None
+        service = UsuarioService(UsuarioRepository(db))
+        usuarios = service.iter_usuarios(
+            role=role_str,
+            include_deleted=include_deleted
+        )
+    except AppException as e:
+        db.close()
+        raise handle_service_exception(e)
+    except Exception as e:
+        db.close()
+        logger.error(f"Error exporting usuarios: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error al exportar usuarios"
+        )
+    
+    def _stream():
+        try:
+            for u in usuarios:
+                yield orjson.dumps(u) + b"\n"
+        except Exception as e:
+            logger.error(f"Error streaming usuarios export: {e}", exc_info=True)
+            db.rollback()
+            yield orjson.dumps({"error": "Error al exportar usuarios"}) + b"\n"
+        finally:
+            db.close()
+    
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
 @router.get("/me", response_model=Usuario)
 async def obtener_mi_usuario(
     current_user=Depends(get_current_user_dep),
@@ -131,6 +131,8 @@ async def obtener_vacunas(
     id_mascota: Optional[str] = Query(None, description="Filtrar por ID de mascota"),
     mascota_nombre: Optional[str] = Query(None, description="Filtrar por nombre de mascota (búsqueda parcial)"),
     include_deleted: bool = Query(False, description="Incluir vacunas eliminadas (solo admin)"),
+    after_fecha: Optional[date] = Query(None, description="Cursor: fecha_aplicacion del último item de la página anterior"),
+    after_id: Optional[str] = Query(None, description="Cursor: id_vacuna del último item de la página anterior"),
     current_user=Depends(get_current_user_dep),
     service: VacunaService = Depends(get_vacuna_service),
 ):
@@ -140,6 +142,15 @@ async def obtener_vacunas(
     Filters are applied BEFORE pagination, so results span all pages.
     Results are ordered by fecha_aplicacion DESC (most recent first).
     
+    Besides page-based pagination, supports keyset pagination: pass the
+    next_cursor values of the previous response as after_fecha/after_id
+    (page is then ignored). next_cursor is null on the last page. Keyset
+    pages have no page number, so pagination then omits page, total_pages
+    and has_previous; has_next and total_items still apply.
+    
+    The total is counted up to settings.simple_pagination_threshold; when
+    exceeded, pagination.is_estimate is true and total_items is a lower bound.
+    
     Visibility rules:
     - admin: sees all vacunas, can include deleted
     - veterinario: sees all vacunas, cannot include deleted
@@ -153,6 +164,8 @@ async def obtener_vacunas(
         id_mascota: Optional mascota ID filter
         mascota_nombre: Optional mascota name filter (partial match)
         include_deleted: Include soft-deleted vacunas (admin only)
+        after_fecha: Keyset cursor date (requires after_id)
+        after_id: Keyset cursor id (requires after_fecha)
         current_user: Current authenticated user
         service: Injected VacunaService
         
@@ -164,8 +177,15 @@ async def obtener_vacunas(
         if include_deleted and current_user.role != "admin":
             include_deleted = False
         
+        if (after_fecha is None) != (after_id is None):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="after_fecha y after_id deben enviarse juntos"
+            )
+        cursor = (after_fecha, after_id) if after_fecha is not None else None
+        
         tipo_str = tipo_vacuna.value if tipo_vacuna else None
-        items, total = service.get_vacunas(
+        items, total, has_more = service.get_vacunas(
             current_user=current_user,
             page=page,
             page_size=page_size,
@@ -173,11 +193,37 @@ async def obtener_vacunas(
             veterinario=veterinario,
             id_mascota=id_mascota,
             mascota_nombre=mascota_nombre,
-            include_deleted=include_deleted
+            include_deleted=include_deleted,
+            cursor=cursor,
+            count_cap=settings.simple_pagination_threshold
         )
-        return create_paginated_response(items, page, page_size, total)
+        response = create_paginated_response(items, page, page_size, total)
+        
+        # The total stops counting past the threshold: flag it as a lower bound
+        response["pagination"]["is_estimate"] = (
+            total > settings.simple_pagination_threshold
+        )
+        
+        # has_next comes from the extra row fetched, so it is exact even when
+        # the total is capped; page metadata does not apply to keyset pages
+        response["pagination"]["has_next"] = has_more
+        if cursor:
+            for key in ("page", "total_pages", "has_previous"):
+                del response["pagination"][key]
+        
+        # Cursor for the next page (keyset pagination)
+        response["next_cursor"] = None
+        if has_more:
+            last = items[-1]
+            response["next_cursor"] = {
+                "after_fecha": last["fecha_aplicacion"],
+                "after_id": last["id_vacuna"],
+            }
+        return response
     except AppException as e:
         raise handle_service_exception(e)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing vacunas: {e}", exc_info=True)
         raise HTTPException(
@@ -4,7 +4,7 @@ Service for Receta business logic.
 Handles all business operations related to recetas (prescriptions) with lineas (medication lines).
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import datetime
 import logging
 
@@ -237,14 +237,7 @@ class RecetaService(BaseService[RecetaORM, RecetaRepository]):
                 include_deleted=include_deleted
             )
         
-        # Convert to summary (without lineas)
-        response_list = []
-        for receta in recetas:
-            cita = self.cita_repo.get_by_id(receta.id_cita)
-            mascota = self.mascota_repo.get_by_id(cita.id_mascota) if cita else None
-            response_list.append(self._to_summary_dict(receta, cita, mascota))
-        
-        return response_list, total_count
+        return self._to_summary_list(recetas), total_count
     
     def get_recetas_by_mascota(
         self,
@@ -292,13 +285,7 @@ class RecetaService(BaseService[RecetaORM, RecetaRepository]):
         )
         total_count = len(all_recetas)
         
-        # Convert to summary (without lineas)
-        response_list = []
-        for receta in recetas:
-            cita = self.cita_repo.get_by_id(receta.id_cita)
-            response_list.append(self._to_summary_dict(receta, cita, mascota))
-        
-        return response_list, total_count
+        return self._to_summary_list(recetas, mascota), total_count
     
     def get_receta_by_cita(
         self,
@@ -457,11 +444,50 @@ class RecetaService(BaseService[RecetaORM, RecetaRepository]):
             lineas=lineas_pydantic if lineas_pydantic else None
         )
     
+    def _to_summary_list(
+        self,
+        recetas: List[RecetaORM],
+        mascota: Optional[MascotaORM] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert a page of recetas to summaries (without lineas).
+        
+        Citas, mascotas and usuarios are loaded with one query each
+        instead of one per receta. When mascota is given (all recetas
+        belong to it) the mascotas query is skipped.
+        """
+        citas = self.cita_repo.get_by_ids({r.id_cita for r in recetas})
+        if mascota:
+            mascotas = {mascota.id: mascota}
+        else:
+            mascotas = self.mascota_repo.get_by_ids({c.id_mascota for c in citas.values()})
+        user_map = self._get_user_map(recetas, mascotas.values())
+        
+        response_list = []
+        for receta in recetas:
+            cita = citas.get(receta.id_cita)
+            mascota_receta = mascotas.get(cita.id_mascota) if cita else None
+            response_list.append(
+                self._to_summary_dict(receta, cita, mascota_receta, user_map)
+            )
+        return response_list
+    
+    def _get_user_map(
+        self,
+        recetas: Iterable[RecetaORM],
+        mascotas: Iterable[Optional[MascotaORM]]
+    ) -> Dict[str, UsuarioORM]:
+        """Load veterinarios and propietarios for a list of recetas in one query."""
+        usernames = {r.veterinario for r in recetas if r.veterinario}
+        usernames |= {m.propietario for m in mascotas if m and m.propietario}
+        return self.usuario_repo.get_by_usernames(usernames)
+    
     def _to_summary_dict(
         self,
         receta: RecetaORM,
         cita: Optional[CitaORM] = None,
-        mascota: Optional[MascotaORM] = None
+        mascota: Optional[MascotaORM] = None,
+        user_map: Optional[Dict[str, UsuarioORM]] = None
     ) -> Dict[str, Any]:
         """Convert ORM to dictionary summary (without lineas)."""
         if not cita:
@@ -469,10 +495,14 @@ class RecetaService(BaseService[RecetaORM, RecetaRepository]):
         if not mascota and cita:
             mascota = self.mascota_repo.get_by_id(cita.id_mascota)
         
-        owner = self._get_owner_data(mascota.propietario if mascota else None)
-        
-        # Get veterinario name and phone from username
-        vet = self.usuario_repo.find_by_username(receta.veterinario) if receta.veterinario else None
+        propietario = mascota.propietario if mascota else None
+        if user_map is not None:
+            owner = user_map.get(propietario) if propietario else None
+            vet = user_map.get(receta.veterinario) if receta.veterinario else None
+        else:
+            owner = self._get_owner_data(propietario)
+            # Get veterinario name and phone from username
+            vet = self.usuario_repo.find_by_username(receta.veterinario) if receta.veterinario else None
         veterinario_nombre = vet.nombre if vet else None
         veterinario_telefono = vet.telefono if vet else None
         
@@ -4,8 +4,7 @@ Service for Usuario business logic.
 Handles all business operations related to usuarios (users).
 """
 
-from typing import List, Optional, Dict, Any
-from uuid import uuid4
+from typing import Iterator, List, Optional, Dict, Any
 import logging
 
 from services.base_service import BaseService
@@ -22,9 +21,13 @@ from core.exceptions import (
 )
 from core.security import validate_uuid
 from core.pagination import calculate_skip
+from core.utils import uuid7
 
 logger = logging.getLogger(__name__)
 
+# Los datos vienen de la BD y ya son válidos: construir sin revalidar
+_build_update_response = UsuarioUpdateResponse.model_construct
+
 
 class UsuarioService(BaseService[UsuarioORM, UsuarioRepository]):
     """Service for managing usuario business logic."""
@@ -66,7 +69,7 @@ class UsuarioService(BaseService[UsuarioORM, UsuarioRepository]):
         
         # Create ORM instance
         usuario_orm = UsuarioORM(
-            id=str(uuid4()),
+            id=str(uuid7()),
             username=usuario_data.username,
             nombre=usuario_data.nombre,
             edad=usuario_data.edad,
@@ -147,6 +150,27 @@ class UsuarioService(BaseService[UsuarioORM, UsuarioRepository]):
         
         return response_list, total_count
     
+    def iter_usuarios(
+        self,
+        role: Optional[str] = None,
+        include_deleted: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate usuarios as response dicts without loading them all at once.
+        
+        Args:
+            role: Filter by role (optional)
+            include_deleted: Include soft-deleted records
+            
+        Returns:
+            Iterator of usuario dicts ordered by username
+        """
+        usuarios = self.repository.iter_all(
+            role=role,
+            include_deleted=include_deleted
+        )
+        return (self._to_response_dict(u) for u in usuarios)
+    
     def update_usuario(
         self,
         usuario_id: str,
@@ -171,16 +195,45 @@ class UsuarioService(BaseService[UsuarioORM, UsuarioRepository]):
             BusinessException: If usuario is deleted
         """
         validate_uuid(usuario_id, "usuario_id")
+        fields_set = usuario_update.model_fields_set
+        
+        # Without a username change there is no cascade or uniqueness check:
+        # a single UPDATE ... RETURNING replaces the SELECT + UPDATE pair
+        if fields_set and "username" not in fields_set:
+            updated = self.repository.update_returning(
+                usuario_id,
+                {field: getattr(usuario_update, field) for field in fields_set},
+                user_id=usuario_id
+            )
+            if updated is not None:
+                self.repository.commit()
+                logger.info(f"Usuario {usuario_id} updated")
+                return _build_update_response(
+                    username=updated.username,
+                    nombre=updated.nombre,
+                    edad=updated.edad,
+                    telefono=updated.telefono
+                )
+            # No row updated: fall through so the read below reports
+            # NotFound or deleted
+        
         usuario = self.repository.get_by_id_or_fail(usuario_id)
         
         # Validate not deleted
         self.validate_not_deleted(usuario)
         
-        update_data = usuario_update.model_dump(exclude_unset=True)
+        # Nothing to change: skip the UPDATE and the commit
+        if not fields_set:
+            return _build_update_response(
+                username=usuario.username,
+                nombre=usuario.nombre,
+                edad=usuario.edad,
+                telefono=usuario.telefono
+            )
         
-        # Check username uniqueness and update references if being updated
-        if "username" in update_data:
-            new_username = update_data["username"]
+        # Check username uniqueness and update references if it actually changes
+        if "username" in fields_set and usuario_update.username != usuario.username:
+            new_username = usuario_update.username
             old_username = usuario.username
             
             if self.repository.exists_username(
@@ -199,13 +252,9 @@ class UsuarioService(BaseService[UsuarioORM, UsuarioRepository]):
             usuario.username = new_username
             logger.info(f"Username updated from '{old_username}' to '{new_username}'")
         
-        # Update other fields
-        if "nombre" in update_data:
-            usuario.nombre = update_data["nombre"]
-        if "edad" in update_data:
-            usuario.edad = update_data["edad"]
-        if "telefono" in update_data:
-            usuario.telefono = update_data["telefono"]
+        # Update other fields (nombre, edad, telefono)
+        for field in fields_set - {"username"}:
+            setattr(usuario, field, getattr(usuario_update, field))
         
         # Save changes
         updated = self.repository.update(usuario, user_id=usuario_id)
@@ -213,7 +262,7 @@ class UsuarioService(BaseService[UsuarioORM, UsuarioRepository]):
         
         logger.info(f"Usuario {usuario_id} updated")
         
-        return UsuarioUpdateResponse(
+        return _build_update_response(
             username=updated.username,
             nombre=updated.nombre,
             edad=updated.edad,
@@ -327,45 +376,16 @@ class UsuarioService(BaseService[UsuarioORM, UsuarioRepository]):
             old_username: The username to be replaced
             new_username: The new username to use
         """
-        from database.models import MascotaORM, CitaORM, VacunaORM, FacturaORM, RecetaORM
-        
-        db = self.repository.db
-        
         try:
-            # Update mascotas.propietario (clients)
-            mascotas_updated = db.query(MascotaORM).filter(
-                MascotaORM.propietario == old_username
-            ).update({MascotaORM.propietario: new_username}, synchronize_session=False)
-            
-            # Update citas.veterinario (veterinarians)
-            citas_updated = db.query(CitaORM).filter(
-                CitaORM.veterinario == old_username
-            ).update({CitaORM.veterinario: new_username}, synchronize_session=False)
-            
-            # Update vacunas.veterinario (veterinarians)
-            vacunas_updated = db.query(VacunaORM).filter(
-                VacunaORM.veterinario == old_username
-            ).update({VacunaORM.veterinario: new_username}, synchronize_session=False)
-            
-            # Update facturas.veterinario (veterinarians)
-            facturas_updated = db.query(FacturaORM).filter(
-                FacturaORM.veterinario == old_username
-            ).update({FacturaORM.veterinario: new_username}, synchronize_session=False)
-            
-            # Update recetas.veterinario (veterinarians)
-            recetas_updated = db.query(RecetaORM).filter(
-                RecetaORM.veterinario == old_username
-            ).update({RecetaORM.veterinario: new_username}, synchronize_session=False)
-            
-            db.flush()
+            updated = self.repository.update_username_references(old_username, new_username)
             
             logger.info(
                 f"Username references updated: "
-                f"{mascotas_updated} mascotas, "
-                f"{citas_updated} citas, "
-                f"{vacunas_updated} vacunas, "
-                f"{facturas_updated} facturas, "
-                f"{recetas_updated} recetas"
+                f"{updated['mascotas']} mascotas, "
+                f"{updated['citas']} citas, "
+                f"{updated['vacunas']} vacunas, "
+                f"{updated['facturas']} facturas, "
+                f"{updated['recetas']} recetas"
             )
         except Exception as e:
             logger.error(f"Error updating username references: {e}")
@@ -4,8 +4,9 @@ Service for Vacuna business logic.
 Handles all business operations related to vacunas (vaccines).
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import date
+from uuid import UUID
 import logging
 
 from services.base_service import BaseService
@@ -13,7 +14,7 @@ from repositories.vacuna_repository import VacunaRepository
 from repositories.mascota_repository import MascotaRepository
 from repositories.usuario_repository import UsuarioRepository
 from database.models import VacunaORM, MascotaORM, UsuarioORM
-from models.vacunas import VacunaCreate, VacunaUpdate, Vacuna
+from models.vacunas import VacunaCreate, VacunaUpdate, Vacuna, TipoVacuna
 from core.exceptions import (
     BusinessException,
     ValidationException,
@@ -47,6 +48,9 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
         super().__init__(vacuna_repository)
         self.mascota_repo = mascota_repository
         self.usuario_repo = usuario_repository
+        # username -> usuario (None if it does not exist). The service is
+        # built per request, so this memoizes lookups within one request.
+        self._user_cache: Dict[str, Optional[UsuarioORM]] = {}
     
     def create_vacuna(
         self,
@@ -68,18 +72,10 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
             NotFoundException: If mascota not found
             ForbiddenException: If user doesn't have permission
         """
-        # Validate mascota exists and is not deleted
-        mascota = self.mascota_repo.get_by_id_or_fail(str(vacuna_data.id_mascota))
-        
-        if mascota.is_deleted:
-            raise BusinessException(
-                "No se puede registrar una vacuna para una mascota inactiva (eliminada)"
-            )
-        
         # Auto-generate fecha_aplicacion with today's date
         fecha_aplicacion = date.today()
         
-        # Validate proxima_dosis if provided
+        # Validate proxima_dosis if provided (no DB access, so check it first)
         if vacuna_data.proxima_dosis:
             if vacuna_data.proxima_dosis <= fecha_aplicacion:
                 raise ValidationException(
@@ -87,6 +83,15 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
                     field="proxima_dosis"
                 )
         
+        # Validate mascota exists and is not deleted (the full row is reused
+        # for the response, so it is loaded once here)
+        mascota = self.mascota_repo.get_by_id_or_fail(str(vacuna_data.id_mascota))
+        
+        if mascota.is_deleted:
+            raise BusinessException(
+                "No se puede registrar una vacuna para una mascota inactiva (eliminada)"
+            )
+        
         # Create vacuna ORM
         vacuna_orm = VacunaORM(
             id_mascota=str(vacuna_data.id_mascota),
@@ -100,7 +105,10 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
         created = self.repository.create(vacuna_orm, user_id=current_user.id)
         self.repository.commit()
         
-        logger.info(f"Vacuna {created.id} registered for mascota {mascota.id} by {current_user.username}")
+        logger.info(
+            "Vacuna %s registered for mascota %s by %s",
+            created.id, mascota.id, current_user.username
+        )
         
         return self._to_response_model(created, mascota)
     
@@ -146,13 +154,18 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
         veterinario: Optional[str] = None,
         id_mascota: Optional[str] = None,
         mascota_nombre: Optional[str] = None,
-        include_deleted: bool = False
-    ) -> tuple[List[Dict[str, Any]], int]:
+        include_deleted: bool = False,
+        cursor: Optional[tuple[date, str]] = None,
+        count_cap: Optional[int] = None
+    ) -> tuple[List[Dict[str, Any]], int, bool]:
         """
         Get list of vacunas with filters based on user permissions.
         
         Filters are applied BEFORE pagination, so search results span all pages.
-        Results are ordered by fecha_aplicacion ASC (closest date first).
+        Results are ordered by fecha_aplicacion DESC (most recent first).
+        When cursor is given, page is ignored and the page starts right after
+        the (fecha_aplicacion, id_vacuna) of the previous page's last item.
+        One extra row is fetched to know whether another page follows.
         
         Args:
             current_user: Current authenticated user
@@ -163,12 +176,32 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
             id_mascota: Optional mascota ID filter
             mascota_nombre: Optional mascota name filter (partial match)
             include_deleted: Include soft-deleted vacunas
+            cursor: Optional (fecha_aplicacion, id_vacuna) keyset cursor
+            count_cap: Optional cap for the total count; a total above the
+                cap (returned as count_cap + 1) means "more than cap"
             
         Returns:
-            Tuple of (list of vacunas, total count)
+            Tuple of (list of vacunas, total count, whether more vacunas follow)
         """
         skip = calculate_skip(page, page_size)
         
+        if cursor:
+            validate_uuid(cursor[1], "after_id")
+        
+        # Solo filtro por mascota: usar la consulta específica por mascota
+        # (índice id_mascota, fecha_aplicacion) y una sola mascota para enriquecer
+        if id_mascota and not (cursor or tipo_vacuna or veterinario or mascota_nombre):
+            mascota = self.mascota_repo.get_by_id(id_mascota)
+            if mascota is None or (
+                current_user.role not in ("admin", "veterinario")
+                and mascota.propietario != current_user.username
+            ):
+                return [], 0, False
+            items, total_count = self._list_by_mascota(
+                mascota, skip, page_size, include_deleted
+            )
+            return items, total_count, skip + len(items) < total_count
+        
         # Apply role-based filtering
         if current_user.role == "admin" or current_user.role == "veterinario":
             # Admin and Veterinario see all vacunas with filters
@@ -179,11 +212,13 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
                 id_mascota=id_mascota,
                 search_term=mascota_nombre,  # Búsqueda libre
                 skip=skip,
-                limit=page_size,
-                include_deleted=include_deleted
+                limit=page_size + 1,
+                include_deleted=include_deleted,
+                cursor=cursor
             )
             
-            total_count = self.repository.count_by_filters(
+            total_count = self._count_vacunas(
+                count_cap,
                 tipo_vacuna=tipo_vacuna,
                 veterinario=veterinario,
                 id_mascota=id_mascota,
@@ -200,10 +235,12 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
                 propietario_username=current_user.username,  # Siempre filtrar por propietario
                 search_term=mascota_nombre,  # Búsqueda adicional dentro de sus mascotas
                 skip=skip,
-                limit=page_size,
-                include_deleted=include_deleted
+                limit=page_size + 1,
+                include_deleted=include_deleted,
+                cursor=cursor
             )
-            total_count = self.repository.count_by_filters(
+            total_count = self._count_vacunas(
+                count_cap,
                 tipo_vacuna=tipo_vacuna,
                 veterinario=veterinario,
                 id_mascota=id_mascota,
@@ -212,13 +249,26 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
                 include_deleted=include_deleted
             )
         
-        # Enrich with mascota and owner data
-        response_list = []
-        for vacuna in vacunas:
-            mascota = self.mascota_repo.get_by_id(vacuna.id_mascota)
-            response_list.append(self._to_response_dict(vacuna, mascota))
+        # The extra row only tells whether there is a next page
+        has_more = len(vacunas) > page_size
+        vacunas = vacunas[:page_size]
         
-        return response_list, total_count
+        # Enrich with mascota and owner data (one query for each)
+        mascotas = self.mascota_repo.get_by_ids({v.id_mascota for v in vacunas})
+        user_map = self._get_user_map(vacunas, mascotas.values())
+        response_list = [
+            self._to_response_dict(vacuna, mascotas.get(vacuna.id_mascota), user_map)
+            for vacuna in vacunas
+        ]
+        
+        return response_list, total_count, has_more
+    
+    def _count_vacunas(self, count_cap: Optional[int], **filters) -> int:
+        """Count vacunas for the list filters, capped when count_cap is given."""
+        if count_cap:
+            # One row past the cap tells "exactly cap" apart from "more than cap"
+            return self.repository.count_by_filters_capped(count_cap + 1, **filters)
+        return self.repository.count_by_filters(**filters)
     
     def get_vacunas_by_mascota(
         self,
@@ -249,27 +299,34 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
         
         skip = page * page_size
         
-        # Get ALL vacunas for this mascota
+        return self._list_by_mascota(mascota, skip, page_size, include_deleted)
+    
+    def _list_by_mascota(
+        self,
+        mascota: MascotaORM,
+        skip: int,
+        limit: int,
+        include_deleted: bool
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """Get a page of vacunas of an already loaded mascota, with total count."""
         vacunas = self.repository.find_by_mascota(
-            id_mascota=mascota_id,
+            id_mascota=mascota.id,
             skip=skip,
-            limit=page_size,
+            limit=limit,
             include_deleted=include_deleted
         )
         
-        # Count total - get all and count
-        all_vacunas = self.repository.find_by_mascota(
-            id_mascota=mascota_id,
-            skip=0,
-            limit=100000,
+        total_count = self.repository.count_by_mascota(
+            id_mascota=mascota.id,
             include_deleted=include_deleted
         )
-        total_count = len(all_vacunas)
         
         # Enrich with data
-        response_list = []
-        for vacuna in vacunas:
-            response_list.append(self._to_response_dict(vacuna, mascota))
+        user_map = self._get_user_map(vacunas, [mascota])
+        response_list = [
+            self._to_response_dict(vacuna, mascota, user_map)
+            for vacuna in vacunas
+        ]
         
         return response_list, total_count
     
@@ -312,14 +369,18 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
         
         update_data = vacuna_update.model_dump(exclude_unset=True)
         
-        for field, value in update_data.items():
-            if field == "tipo_vacuna" and value:
-                setattr(vacuna, field, enum_to_value(value))
-            elif value is not None:
-                setattr(vacuna, field, value)
+        # Normalize values once (enum -> stored value, drop explicit nulls)
+        processed = {
+            field: enum_to_value(value) if field == "tipo_vacuna" else value
+            for field, value in update_data.items()
+            if value is not None
+        }
+        for field, value in processed.items():
+            setattr(vacuna, field, value)
         
         # Validate proxima_dosis if updated
-        if vacuna.proxima_dosis and vacuna.proxima_dosis <= vacuna.fecha_aplicacion:
+        proxima_dosis = processed.get("proxima_dosis", vacuna.proxima_dosis)
+        if proxima_dosis and proxima_dosis <= vacuna.fecha_aplicacion:
             raise ValidationException(
                 message="La próxima dosis debe ser posterior a la fecha de aplicación",
                 field="proxima_dosis"
@@ -328,7 +389,7 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
         updated = self.repository.update(vacuna, user_id=current_user.id)
         self.repository.commit()
         
-        logger.info(f"Vacuna {vacuna_id} updated")
+        logger.info("Vacuna %s updated", vacuna_id)
         
         mascota = self.mascota_repo.get_by_id(updated.id_mascota)
         return self._to_response_model(updated, mascota)
@@ -369,7 +430,7 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
         self.repository.delete(vacuna, user_id=current_user.id, hard=False)
         self.repository.commit()
         
-        logger.info(f"Vacuna {vacuna_id} deleted")
+        logger.info("Vacuna %s deleted", vacuna_id)
     
     def get_proximas_dosis(
         self,
@@ -386,50 +447,108 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
         Returns:
             List of vacunas with upcoming doses
         """
+        # Admin/veterinario see all; clientes only their own mascotas,
+        # filtered in SQL so the limit counts only visible vacunas
+        is_staff = current_user.role in ("admin", "veterinario")
         vacunas = self.repository.find_proximas_dosis(
             fecha_limite=fecha_limite,
             skip=0,
-            limit=100
+            limit=100,
+            propietario_username=None if is_staff else current_user.username
         )
         
-        # Filter by permissions
-        result = []
-        for vacuna in vacunas:
-            mascota = self.mascota_repo.get_by_id(vacuna.id_mascota)
-            if mascota:
-                if (current_user.role == "admin" or 
-                    current_user.role == "veterinario" or
-                    mascota.propietario == current_user.username):
-                    result.append(self._to_response_model(vacuna, mascota))
-        
-        return result
+        # Mascotas in a single query
+        mascotas = self.mascota_repo.get_by_ids({v.id_mascota for v in vacunas})
+        visibles = [
+            (vacuna, mascotas[vacuna.id_mascota])
+            for vacuna in vacunas
+            if vacuna.id_mascota in mascotas
+        ]
+        
+        user_map = self._get_user_map(
+            [vacuna for vacuna, _ in visibles],
+            [mascota for _, mascota in visibles]
+        )
+        return [
+            self._to_response_model(vacuna, mascota, user_map)
+            for vacuna, mascota in visibles
+        ]
+    
+    def _resolve_user(self, username: Optional[str]) -> Optional[UsuarioORM]:
+        """Get a usuario by username, memoized for the life of the service."""
+        if not username:
+            return None
+        if username not in self._user_cache:
+            self._user_cache[username] = self.usuario_repo.find_by_username(username)
+        return self._user_cache[username]
     
     def _get_owner_data(self, propietario_username: Optional[str]) -> Optional[UsuarioORM]:
         """Get owner usuario data."""
-        if not propietario_username:
-            return None
-        return self.usuario_repo.find_by_username(propietario_username)
+        return self._resolve_user(propietario_username)
     
-    def _to_response_model(self, vacuna: VacunaORM, mascota: Optional[MascotaORM] = None) -> Vacuna:
+    def _get_user_map(
+        self,
+        vacunas: Iterable[VacunaORM],
+        mascotas: Iterable[Optional[MascotaORM]]
+    ) -> Dict[str, UsuarioORM]:
+        """Load veterinarios and propietarios for a list of vacunas in one query."""
+        usernames = {v.veterinario for v in vacunas if v.veterinario}
+        usernames |= {m.propietario for m in mascotas if m and m.propietario}
+        
+        # Only query the usernames not memoized yet
+        missing = usernames - self._user_cache.keys()
+        if missing:
+            found = self.usuario_repo.get_by_usernames(missing)
+            for username in missing:
+                self._user_cache[username] = found.get(username)
+        
+        return {
+            username: self._user_cache[username]
+            for username in usernames
+            if self._user_cache[username] is not None
+        }
+    
+    def _get_related_users(
+        self,
+        vacuna: VacunaORM,
+        mascota: Optional[MascotaORM],
+        user_map: Optional[Dict[str, UsuarioORM]] = None
+    ) -> tuple[Optional[UsuarioORM], Optional[UsuarioORM]]:
+        """Get (owner, veterinario) usuarios, from user_map when given."""
+        propietario = mascota.propietario if mascota else None
+        
+        if user_map is not None:
+            owner = user_map.get(propietario) if propietario else None
+            vet = user_map.get(vacuna.veterinario) if vacuna.veterinario else None
+            return owner, vet
+        
+        return self._get_owner_data(propietario), self._resolve_user(vacuna.veterinario)
+    
+    def _to_response_model(
+        self,
+        vacuna: VacunaORM,
+        mascota: Optional[MascotaORM] = None,
+        user_map: Optional[Dict[str, UsuarioORM]] = None
+    ) -> Vacuna:
         """Convert ORM to Pydantic response model."""
         if not mascota:
             mascota = self.mascota_repo.get_by_id(vacuna.id_mascota)
         
-        owner = self._get_owner_data(mascota.propietario if mascota else None)
-        
-        # Get veterinario name and phone from username
-        vet = self.usuario_repo.find_by_username(vacuna.veterinario) if vacuna.veterinario else None
+        # Owner and veterinario (name and phone) from their usernames
+        owner, vet = self._get_related_users(vacuna, mascota, user_map)
         veterinario_nombre = vet.nombre if vet else None
         veterinario_telefono = vet.telefono if vet else None
         
-        return Vacuna(
-            id_vacuna=vacuna.id,
-            id_mascota=vacuna.id_mascota,
+        # Data comes from the DB (validated on write): build without
+        # re-validating, converting only the typed fields
+        return Vacuna.model_construct(
+            id_vacuna=UUID(vacuna.id),
+            id_mascota=UUID(vacuna.id_mascota),
             mascota_nombre=mascota.nombre if mascota else "",
             propietario_username=owner.username if owner else (mascota.propietario if mascota else None),
             propietario_nombre=owner.nombre if owner else None,
             propietario_telefono=owner.telefono if owner else None,
-            tipo_vacuna=normalize_stored_enum(vacuna.tipo_vacuna),
+            tipo_vacuna=TipoVacuna(normalize_stored_enum(vacuna.tipo_vacuna)),
             fecha_aplicacion=vacuna.fecha_aplicacion,
             veterinario=vacuna.veterinario,  # username
             veterinario_nombre=veterinario_nombre,  # nombre completo
@@ -438,15 +557,18 @@ class VacunaService(BaseService[VacunaORM, VacunaRepository]):
             proxima_dosis=vacuna.proxima_dosis
         )
     
-    def _to_response_dict(self, vacuna: VacunaORM, mascota: Optional[MascotaORM] = None) -> Dict[str, Any]:
+    def _to_response_dict(
+        self,
+        vacuna: VacunaORM,
+        mascota: Optional[MascotaORM] = None,
+        user_map: Optional[Dict[str, UsuarioORM]] = None
+    ) -> Dict[str, Any]:
         """Convert ORM to dictionary for response."""
         if not mascota:
             mascota = self.mascota_repo.get_by_id(vacuna.id_mascota)
         
-        owner = self._get_owner_data(mascota.propietario if mascota else None)
-        
-        # Get veterinario name and phone from username
-        vet = self.usuario_repo.find_by_username(vacuna.veterinario) if vacuna.veterinario else None
+        # Owner and veterinario (name and phone) from their usernames
+        owner, vet = self._get_related_users(vacuna, mascota, user_map)
         veterinario_nombre = vet.nombre if vet else None
         veterinario_telefono = vet.telefono if vet else None
         
@@ -6,10 +6,12 @@ Este módulo contiene fixtures reutilizables para todos los tests.
 
 import pytest
 import os
-from typing import Generator, Dict, Any
-from datetime import datetime, date, timedelta
+from uuid import UUID, uuid4
+from functools import lru_cache
+from typing import Generator, Dict, Any, List, Tuple
+from datetime import datetime, date, time, timedelta, timezone
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
@@ -17,17 +19,38 @@ from fastapi.testclient import TestClient
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
 from main import app
-from database.db import get_db, Base, hash_password
-from database.models import UsuarioORM, MascotaORM
+from database.db import get_db, Base, hash_password, generar_numero_factura_uuid
+from database.models import UsuarioORM, MascotaORM, CitaORM, FacturaORM, RecetaORM
+from repositories.factura_repository import FacturaRepository
+from repositories.receta_repository import RecetaRepository
 from auth import create_access_token
 from config import settings
 
 
+# ==================== Password Hashing ====================
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Use a single PBKDF2 iteration during tests.
+    
+    hash_password y verify_password siguen siendo los reales (con salt y
+    comparación), solo se evita el costo de 100_000 iteraciones por usuario.
+    """
+    mp = pytest.MonkeyPatch()
+    mp.setattr("database.db.PBKDF2_ITERATIONS", 1)
+    yield
+    mp.undo()
+
+
 # ==================== Database Fixtures ====================
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create an in-memory SQLite database engine for testing."""
+    """Create an in-memory SQLite database engine shared by the whole run.
+    
+    El esquema se crea una sola vez; cada test queda aislado dentro de una
+    transacción que se revierte al final (ver db_session).
+    """
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
@@ -39,7 +62,19 @@ def db_engine():
     def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        # La base de tests es desechable: sin fsync ni journal en disco
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
         cursor.close()
+        # pysqlite maneja BEGIN por su cuenta y rompe los SAVEPOINT:
+        # desactivarlo y emitir BEGIN desde SQLAlchemy
+        dbapi_conn.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
     
     Base.metadata.create_all(bind=engine)
     yield engine
@@ -49,21 +84,36 @@ def db_engine():
 
 @pytest.fixture(scope="function")
 def db_session(db_engine) -> Generator[Session, None, None]:
-    """Create a new database session for a test."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False,
+    """Create a new database session for a test.
+    
+    La sesión trabaja sobre una conexión con una transacción externa: los
+    commit() del código bajo prueba solo liberan SAVEPOINTs, y al terminar
+    el test se revierte la transacción externa, dejando la base vacía.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
         autoflush=False,
-        bind=db_engine
+        join_transaction_mode="create_savepoint",
     )
-    session = TestingSessionLocal()
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient, None, None]:
+    """TestClient shared by the whole run (the app lifespan runs once)."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db_session: Session) -> Generator[TestClient, None, None]:
+def client(app_client: TestClient, db_session: Session) -> Generator[TestClient, None, None]:
     """Create a test client with database session override."""
     def override_get_db():
         try:
@@ -72,15 +122,25 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    app_client.cookies.clear()
     
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
     
     app.dependency_overrides.clear()
 
 
 # ==================== User Fixtures ====================
 
+@lru_cache(maxsize=None)
+def _password_hash(password: str) -> Tuple[str, str]:
+    """Hash a test password once per run and reuse (salt, hash).
+    
+    Se calcula al primer uso, ya con PBKDF2_ITERATIONS reducido por
+    fast_password_hashing, para que verify_password lo acepte.
+    """
+    return hash_password(password)
+
+
 @pytest.fixture
 def cliente_data() -> Dict[str, Any]:
     """Sample cliente data for testing."""
@@ -120,7 +180,7 @@ def admin_data() -> Dict[str, Any]:
 @pytest.fixture
 def cliente_usuario(db_session: Session, cliente_data: Dict[str, Any]) -> UsuarioORM:
     """Create a cliente user in the database."""
-    salt_hex, hash_hex = hash_password(cliente_data["password"])
+    salt_hex, hash_hex = _password_hash(cliente_data["password"])
     usuario = UsuarioORM(
         id="12345678-1234-5678-1234-567812345678",
         username=cliente_data["username"],
@@ -132,7 +192,7 @@ def cliente_usuario(db_session: Session, cliente_data: Dict[str, Any]) -> Usuari
         password_hash=hash_hex,
     )
     db_session.add(usuario)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(usuario)
     return usuario
 
@@ -140,7 +200,7 @@ def cliente_usuario(db_session: Session, cliente_data: Dict[str, Any]) -> Usuari
 @pytest.fixture
 def veterinario_usuario(db_session: Session, veterinario_data: Dict[str, Any]) -> UsuarioORM:
     """Create a veterinario user in the database."""
-    salt_hex, hash_hex = hash_password(veterinario_data["password"])
+    salt_hex, hash_hex = _password_hash(veterinario_data["password"])
     usuario = UsuarioORM(
         id="87654321-4321-8765-4321-876543218765",
         username=veterinario_data["username"],
@@ -152,7 +212,7 @@ def veterinario_usuario(db_session: Session, veterinario_data: Dict[str, Any]) -
         password_hash=hash_hex,
     )
     db_session.add(usuario)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(usuario)
     return usuario
 
@@ -160,7 +220,7 @@ def veterinario_usuario(db_session: Session, veterinario_data: Dict[str, Any]) -
 @pytest.fixture
 def admin_usuario(db_session: Session, admin_data: Dict[str, Any]) -> UsuarioORM:
     """Create an admin user in the database."""
-    salt_hex, hash_hex = hash_password(admin_data["password"])
+    salt_hex, hash_hex = _password_hash(admin_data["password"])
     usuario = UsuarioORM(
         id="ffffffff-ffff-ffff-ffff-ffffffffffff",
         username=admin_data["username"],
@@ -172,29 +232,46 @@ def admin_usuario(db_session: Session, admin_data: Dict[str, Any]) -> UsuarioORM
         password_hash=hash_hex,
     )
     db_session.add(usuario)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(usuario)
     return usuario
 
 
 # ==================== Auth Token Fixtures ====================
 
+@pytest.fixture(scope="session")
+def token_cache() -> Dict[str, str]:
+    """JWT tokens by user id, minted once for the whole test session.
+    
+    Los usuarios de prueba tienen ids fijos, así que el token sigue siendo
+    válido en cada test aunque el usuario se vuelva a insertar.
+    """
+    return {}
+
+
+def _cached_token(token_cache: Dict[str, str], usuario: UsuarioORM) -> str:
+    """Return the cached token for usuario, creating it on first use."""
+    if usuario.id not in token_cache:
+        token_cache[usuario.id] = create_access_token(data={"sub": usuario.id})
+    return token_cache[usuario.id]
+
+
 @pytest.fixture
-def cliente_token(cliente_usuario: UsuarioORM) -> str:
+def cliente_token(cliente_usuario: UsuarioORM, token_cache: Dict[str, str]) -> str:
     """Generate a valid JWT token for cliente user."""
-    return create_access_token(data={"sub": cliente_usuario.id})
+    return _cached_token(token_cache, cliente_usuario)
 
 
 @pytest.fixture
-def veterinario_token(veterinario_usuario: UsuarioORM) -> str:
+def veterinario_token(veterinario_usuario: UsuarioORM, token_cache: Dict[str, str]) -> str:
     """Generate a valid JWT token for veterinario user."""
-    return create_access_token(data={"sub": veterinario_usuario.id})
+    return _cached_token(token_cache, veterinario_usuario)
 
 
 @pytest.fixture
-def admin_token(admin_usuario: UsuarioORM) -> str:
+def admin_token(admin_usuario: UsuarioORM, token_cache: Dict[str, str]) -> str:
     """Generate a valid JWT token for admin user."""
-    return create_access_token(data={"sub": admin_usuario.id})
+    return _cached_token(token_cache, admin_usuario)
 
 
 @pytest.fixture
@@ -258,7 +335,7 @@ def mascota_instance(
         propietario=cliente_usuario.username,
     )
     db_session.add(mascota)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(mascota)
     return mascota
 
@@ -280,11 +357,27 @@ def mascota_cliente(
         propietario=cliente_usuario.username,
     )
     db_session.add(mascota)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(mascota)
     return mascota
 
 
+@pytest.fixture
+def vet_mascota(db_session: Session, veterinario_usuario: UsuarioORM) -> MascotaORM:
+    """Create a mascota owned by the veterinario user."""
+    mascota = MascotaORM(
+        nombre="Mascota del Vet",
+        tipo="perro",
+        raza="Bulldog",
+        edad=2,
+        peso=15.0,
+        propietario=veterinario_usuario.username,
+    )
+    db_session.add(mascota)
+    db_session.flush()
+    return mascota
+
+
 @pytest.fixture
 def mascota_otro_cliente(
     db_session: Session,
@@ -293,9 +386,8 @@ def mascota_otro_cliente(
 ) -> MascotaORM:
     """Create a mascota for another cliente (used to test access control)."""
     # Create another cliente user first
-    from uuid import uuid4
     otro_cliente_id = str(uuid4())
-    salt_hex, hash_hex = hash_password("password456")
+    salt_hex, hash_hex = _password_hash("password456")
     otro_cliente = UsuarioORM(
         id=otro_cliente_id,
         username="otroclient",
@@ -307,7 +399,7 @@ def mascota_otro_cliente(
         password_hash=hash_hex,
     )
     db_session.add(otro_cliente)
-    db_session.commit()
+    db_session.flush()
     
     mascota = MascotaORM(
         id="bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb",
@@ -319,13 +411,19 @@ def mascota_otro_cliente(
         propietario=otro_cliente.username,
     )
     db_session.add(mascota)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(mascota)
     return mascota
 
 
 # ==================== Cita Fixtures ====================
 
+@pytest.fixture(scope="module")
+def now_utc() -> datetime:
+    """Hora UTC actual, calculada una vez por módulo (los desfases son de días completos)."""
+    return datetime.now(timezone.utc)
+
+
 @pytest.fixture
 def cita_instance(
     db_session: Session,
@@ -333,21 +431,99 @@ def cita_instance(
     veterinario_usuario: UsuarioORM
 ):
     """Create a cita in the database."""
-    from database.models import CitaORM
-    
     cita = CitaORM(
         id="cccccccc-cccc-cccc-cccc-cccccccccccc",
         id_mascota=mascota_instance.id,
-        fecha=datetime.fromisoformat((date.today() + timedelta(days=1)).isoformat() + "T10:00:00"),
+        fecha=days_from_today_at(1, 10),
         motivo="Control de rutina",
         veterinario=veterinario_usuario.username,
     )
     db_session.add(cita)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(cita)
     return cita
 
 
+@pytest.fixture
+def make_cita(
+    db_session: Session,
+    now_utc: datetime,
+    mascota_instance: MascotaORM,
+    veterinario_usuario: UsuarioORM
+):
+    """Return a callable that creates a pending cita for mascota_instance."""
+    def _make(**overrides) -> CitaORM:
+        values = {
+            "id_mascota": mascota_instance.id,
+            "fecha": now_utc + timedelta(days=5),
+            "motivo": "Revisión",
+            "veterinario": veterinario_usuario.username,
+            "estado": "pendiente",
+        }
+        values.update(overrides)
+        cita = CitaORM(**values)
+        db_session.add(cita)
+        db_session.flush()
+        return cita
+    
+    return _make
+
+
+# ==================== Factura Fixtures ====================
+
+def _build_factura(mascota: MascotaORM, veterinario: UsuarioORM, **overrides):
+    """Build an unsaved FacturaORM: consulta general, 100 + 19 of IVA."""
+    factura_id = str(uuid4())
+    values = {
+        "id": factura_id,
+        "numero_factura": generar_numero_factura_uuid(factura_id),
+        "id_mascota": mascota.id,
+        "fecha_factura": date.today(),
+        "tipo_servicio": "consulta_general",
+        "descripcion": "Consulta",
+        "veterinario": veterinario.username,
+        "valor_servicio": 100.0,
+        "iva": 19.0,
+        "descuento": 0.0,
+        "total": 119.0,
+    }
+    values.update(overrides)
+    return FacturaORM(**values)
+
+
+@pytest.fixture
+def make_factura(
+    db_session: Session,
+    veterinario_usuario: UsuarioORM
+):
+    """Return a callable that creates a factura for a mascota."""
+    factura_repo = FacturaRepository(db_session)
+    
+    def _make(mascota: MascotaORM, **overrides):
+        factura = _build_factura(mascota, veterinario_usuario, **overrides)
+        return factura_repo.create(factura, user_id=veterinario_usuario.id)
+    
+    return _make
+
+
+@pytest.fixture
+def make_facturas(
+    db_session: Session,
+    veterinario_usuario: UsuarioORM
+):
+    """Return a callable that creates one factura per overrides dict in one flush."""
+    factura_repo = FacturaRepository(db_session)
+    
+    def _make(mascota: MascotaORM, overrides: List[Dict[str, Any]]):
+        facturas = [
+            _build_factura(mascota, veterinario_usuario, **values)
+            for values in overrides
+        ]
+        return factura_repo.create_many(facturas, user_id=veterinario_usuario.id)
+    
+    return _make
+
+
 # ==================== Vacuna Fixtures ====================
 
 @pytest.fixture
@@ -368,16 +544,63 @@ def vacuna_instance(
         veterinario=veterinario_usuario.username,
     )
     db_session.add(vacuna)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(vacuna)
     return vacuna
 
 
+# ==================== Receta Fixtures ====================
+
+def _build_receta(cita, veterinario: UsuarioORM, **overrides):
+    """Build an unsaved RecetaORM: issued now, indicaciones "Test"."""
+    values = {
+        "id": str(uuid4()),
+        "id_cita": str(cita.id),
+        "fecha_emision": datetime.now(),
+        "indicaciones": "Test",
+        "veterinario": veterinario.username,
+    }
+    values.update(overrides)
+    return RecetaORM(**values)
+
+
+@pytest.fixture
+def make_receta(
+    db_session: Session,
+    veterinario_usuario: UsuarioORM
+):
+    """Return a callable that creates a receta for a cita."""
+    receta_repo = RecetaRepository(db_session)
+    
+    def _make(cita, **overrides):
+        receta = _build_receta(cita, veterinario_usuario, **overrides)
+        return receta_repo.create(receta, user_id=veterinario_usuario.id)
+    
+    return _make
+
+
+@pytest.fixture
+def make_recetas(
+    db_session: Session,
+    veterinario_usuario: UsuarioORM
+):
+    """Return a callable that creates one receta per overrides dict in one flush."""
+    receta_repo = RecetaRepository(db_session)
+    
+    def _make(cita, overrides: List[Dict[str, Any]]):
+        recetas = [
+            _build_receta(cita, veterinario_usuario, **values)
+            for values in overrides
+        ]
+        return receta_repo.create_many(recetas, user_id=veterinario_usuario.id)
+    
+    return _make
+
+
 # ==================== Utility Functions ====================
 
 def assert_valid_uuid(uuid_string: str) -> bool:
     """Assert that a string is a valid UUID."""
-    from uuid import UUID
     try:
         UUID(str(uuid_string))
         return True
@@ -392,3 +615,21 @@ def assert_datetime_format(dt_string: str) -> bool:
         return True
     except (ValueError, AttributeError):
         return False
+
+
+def assert_all_equal(items: List[Dict[str, Any]], key: str, expected: Any) -> None:
+    """Assert that every item has ``item[key] == expected``.
+    
+    Compara el conjunto de valores distintos, así que una lista vacía pasa
+    (como all()); el mensaje de error muestra los items que no coinciden.
+    """
+    values = {item[key] for item in items}
+    assert values <= {expected}, (
+        f"Expected {key}={expected!r} for all items, got: "
+        f"{[item for item in items if item[key] != expected]}"
+    )
+
+
+def days_from_today_at(days: int, hour: int) -> datetime:
+    """Return a naive datetime ``days`` after today at ``hour``:00."""
+    return datetime.combine(date.today() + timedelta(days=days), time(hour, 0))
@@ -13,11 +13,16 @@ Las pruebas cubren:
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
-from typing import Dict, Any
-from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict
+from datetime import datetime, timedelta
 
 from database.models import CitaORM, UsuarioORM, MascotaORM
-from tests.conftest import assert_valid_uuid, assert_datetime_format
+from models.citas import Cita
+from tests.conftest import assert_all_equal
+
+
+# Campos comunes del cuerpo de POST /citas/
+BASE_CITA = {"motivo": "Revisión"}
 
 
 class TestCitaCreation:
@@ -25,6 +30,7 @@ class TestCitaCreation:
     
     def test_agendar_cita_como_cliente_exitoso(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         cliente_usuario: UsuarioORM,
@@ -35,7 +41,7 @@ class TestCitaCreation:
         """Prueba que el cliente puede agendar una cita para su propia mascota."""
         cita_data = {
             "id_mascota": str(mascota_instance.id),
-            "fecha": (datetime.now(timezone.utc) + timedelta(days=5)).isoformat(),
+            "fecha": (now_utc + timedelta(days=5)).isoformat(),
             "motivo": "Revisión general",
             "veterinario": veterinario_usuario.username
         }
@@ -49,36 +55,38 @@ class TestCitaCreation:
         assert response.status_code == 201
         data = response.json()
         
-        # Verificar estructura de la respuesta
-        assert "id_cita" in data
-        assert "id_mascota" in data
-        assert "fecha" in data
-        assert "motivo" in data
-        assert "veterinario" in data
-        assert "estado" in data
-        assert "mascota_nombre" in data
+        # Verificar estructura y formatos (UUID, fecha) con el modelo de respuesta
+        Cita.model_validate(data)
         
         # Verificar correcci�n de los datos
         assert data["motivo"] == "Revisión general"
         assert data["veterinario"] == veterinario_usuario.username
         assert data["estado"] == "pendiente"
         assert data["mascota_nombre"] == mascota_instance.nombre
-        
-        # Verificar formato de UUID
-        assert assert_valid_uuid(data["id_cita"])
-        assert assert_datetime_format(data["fecha"])
     
-    def test_agendar_cita_como_veterinario(
+    @pytest.mark.parametrize(
+        "headers_fixture,expected_status",
+        [
+            # Podría fallar debido a la verificación de propiedad
+            ("auth_headers_veterinario", {201, 403}),
+            ("auth_headers_admin", {201}),
+        ],
+        ids=["veterinario", "admin"]
+    )
+    def test_agendar_cita_como_personal(
         self,
+        now_utc: datetime,
+        request: pytest.FixtureRequest,
         client: TestClient,
-        auth_headers_veterinario: Dict[str, str],
         mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM
+        veterinario_usuario: UsuarioORM,
+        headers_fixture: str,
+        expected_status: set
     ):
-        """Prueba que el veterinario puede agendar una cita."""
+        """Prueba que veterinario y admin pueden agendar una cita."""
         cita_data = {
             "id_mascota": str(mascota_instance.id),
-            "fecha": (datetime.now(timezone.utc) + timedelta(days=3)).isoformat(),
+            "fecha": (now_utc + timedelta(days=3)).isoformat(),
             "motivo": "Vacunación",
             "veterinario": veterinario_usuario.username
         }
@@ -86,37 +94,14 @@ class TestCitaCreation:
         response = client.post(
             "/citas/",
             json=cita_data,
-            headers=auth_headers_veterinario
+            headers=request.getfixturevalue(headers_fixture)
         )
         
-        # Podr�a fallar debido a la verificaci�n de propiedad
-        assert response.status_code in [201, 403]
-    
-    def test_agendar_cita_como_admin(
-        self,
-        client: TestClient,
-        auth_headers_admin: Dict[str, str],
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM
-    ):
-        """Prueba que el admin puede agendar una cita para cualquier mascota."""
-        cita_data = {
-            "id_mascota": str(mascota_instance.id),
-            "fecha": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat(),
-            "motivo": "Revisión dental",
-            "veterinario": veterinario_usuario.username
-        }
-        
-        response = client.post(
-            "/citas/",
-            json=cita_data,
-            headers=auth_headers_admin
-        )
-        
-        assert response.status_code == 201
+        assert response.status_code in expected_status
     
     def test_agendar_cita_mascota_inexistente(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         veterinario_usuario: UsuarioORM
@@ -124,9 +109,9 @@ class TestCitaCreation:
         """Prueba que agendar una cita para una mascota inexistente falla."""
         fake_mascota_id = "00000000-0000-0000-0000-000000000000"
         cita_data = {
+            **BASE_CITA,
             "id_mascota": fake_mascota_id,
-            "fecha": (datetime.now(timezone.utc) + timedelta(days=5)).isoformat(),
-            "motivo": "Revisión",
+            "fecha": (now_utc + timedelta(days=5)).isoformat(),
             "veterinario": veterinario_usuario.username
         }
         
@@ -140,15 +125,16 @@ class TestCitaCreation:
     
     def test_agendar_cita_veterinario_inexistente(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         mascota_instance: MascotaORM
     ):
         """Prueba que agendar una cita con veterinario inexistente falla."""
         cita_data = {
+            **BASE_CITA,
             "id_mascota": str(mascota_instance.id),
-            "fecha": (datetime.now(timezone.utc) + timedelta(days=5)).isoformat(),
-            "motivo": "Revisión",
+            "fecha": (now_utc + timedelta(days=5)).isoformat(),
             "veterinario": "nonexistent_vet"
         }
         
@@ -162,6 +148,7 @@ class TestCitaCreation:
     
     def test_agendar_cita_fecha_pasada_falla(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         mascota_instance: MascotaORM,
@@ -169,9 +156,9 @@ class TestCitaCreation:
     ):
         """Prueba que agendar una cita con fecha pasada falla."""
         cita_data = {
+            **BASE_CITA,
             "id_mascota": str(mascota_instance.id),
-            "fecha": (datetime.now(timezone.utc) - timedelta(days=5)).isoformat(),
-            "motivo": "Revisión",
+            "fecha": (now_utc - timedelta(days=5)).isoformat(),
             "veterinario": veterinario_usuario.username
         }
         
@@ -185,15 +172,16 @@ class TestCitaCreation:
     
     def test_agendar_cita_sin_autenticacion_falla(
         self,
+        now_utc: datetime,
         client: TestClient,
         mascota_instance: MascotaORM,
         veterinario_usuario: UsuarioORM
     ):
         """Prueba que agendar una cita sin autenticaci�n falla."""
         cita_data = {
+            **BASE_CITA,
             "id_mascota": str(mascota_instance.id),
-            "fecha": (datetime.now(timezone.utc) + timedelta(days=5)).isoformat(),
-            "motivo": "Revisión",
+            "fecha": (now_utc + timedelta(days=5)).isoformat(),
             "veterinario": veterinario_usuario.username
         }
         
@@ -210,20 +198,10 @@ class TestCitaList:
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         cliente_usuario: UsuarioORM,
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que el cliente solo ve sus propias citas."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita()
         
         response = client.get("/citas/", headers=auth_headers_cliente)
         
@@ -236,27 +214,20 @@ class TestCitaList:
         assert "success" in data
         
         # Verificar que todas las citas son del cliente
-        for cita_item in data["data"]:
-            assert cita_item["propietario_username"] == cliente_usuario.username
+        assert_all_equal(data["data"], "propietario_username", cliente_usuario.username)
     
     def test_listar_citas_veterinario_propias(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que el veterinario ve sus citas."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=3),
-            motivo="Vacunación",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
+        cita = make_cita(
+            fecha=now_utc + timedelta(days=3),
+            motivo="Vacunación"
         )
-        db_session.add(cita)
-        db_session.commit()
         
         response = client.get("/citas/", headers=auth_headers_veterinario)
         
@@ -270,21 +241,11 @@ class TestCitaList:
         self,
         client: TestClient,
         auth_headers_admin: Dict[str, str],
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que el admin ve todas las citas."""
         # Crear una cita
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita()
         
         response = client.get("/citas/", headers=auth_headers_admin)
         
@@ -297,6 +258,7 @@ class TestCitaList:
     
     def test_listar_citas_filtro_por_estado(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_admin: Dict[str, str],
         mascota_instance: MascotaORM,
@@ -306,14 +268,14 @@ class TestCitaList:
         """Prueba filtrado de citas por estado."""
         cita1 = CitaORM(
             id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=1),
+            fecha=now_utc + timedelta(days=1),
             motivo="Revisión",
             veterinario=veterinario_usuario.username,
             estado="pendiente"
         )
         cita2 = CitaORM(
             id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) - timedelta(days=5),
+            fecha=now_utc - timedelta(days=5),
             motivo="Revisión",
             veterinario=veterinario_usuario.username,
             estado="completada"
@@ -330,11 +292,12 @@ class TestCitaList:
         data = response.json()
         
         # Todas las citas retornadas deben ser pendiente
-        for cita in data["data"]:
-            assert cita["estado"] == "pendiente"
+        assert_all_equal(data["data"], "estado", "pendiente")
     
+    @pytest.mark.slow
     def test_listar_citas_paginacion(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_admin: Dict[str, str],
         mascota_instance: MascotaORM,
@@ -343,15 +306,16 @@ class TestCitaList:
     ):
         """Prueba que la paginaci�n funciona correctamente."""
         # Crear m�ltiples citas
-        for i in range(10):
-            cita = CitaORM(
+        db_session.add_all([
+            CitaORM(
                 id_mascota=mascota_instance.id,
-                fecha=datetime.now(timezone.utc) + timedelta(days=i),
+                fecha=now_utc + timedelta(days=i),
                 motivo=f"Revisión {i}",
                 veterinario=veterinario_usuario.username,
                 estado="pendiente"
             )
-            db_session.add(cita)
+            for i in range(10)
+        ])
         db_session.commit()
         
         # Probar primera p�gina
@@ -372,30 +336,24 @@ class TestCitaList:
 class TestCitaGet:
     """Pruebas para obtener cita por ID."""
     
-    def test_obtener_cita_propio_como_cliente(
+    @pytest.mark.parametrize(
+        "headers_fixture",
+        ["auth_headers_cliente", "auth_headers_veterinario", "auth_headers_admin"],
+        ids=["cliente", "veterinario", "admin"]
+    )
+    def test_obtener_cita_por_rol(
         self,
+        request: pytest.FixtureRequest,
         client: TestClient,
-        auth_headers_cliente: Dict[str, str],
-        cliente_usuario: UsuarioORM,
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        headers_fixture: str,
+        make_cita: Callable[..., CitaORM]
     ):
-        """Prueba que el cliente puede obtener su propia cita."""
-        # Crear una cita
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        """Prueba que el propietario, su veterinario y el admin pueden obtener la cita."""
+        cita = make_cita()
         
         response = client.get(
             f"/citas/{cita.id}",
-            headers=auth_headers_cliente
+            headers=request.getfixturevalue(headers_fixture)
         )
         
         assert response.status_code == 200
@@ -404,61 +362,6 @@ class TestCitaGet:
         assert data["id_cita"] == cita.id
         assert data["motivo"] == "Revisión"
     
-    def test_obtener_cita_como_veterinario(
-        self,
-        client: TestClient,
-        auth_headers_veterinario: Dict[str, str],
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
-    ):
-        """Prueba que el veterinario puede obtener su propia cita."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=3),
-            motivo="Vacunación",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
-        
-        response = client.get(
-            f"/citas/{cita.id}",
-            headers=auth_headers_veterinario
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["motivo"] == "Vacunación"
-    
-    def test_obtener_cita_como_admin(
-        self,
-        client: TestClient,
-        auth_headers_admin: Dict[str, str],
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
-    ):
-        """Prueba que el admin puede obtener cualquier cita."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
-        
-        response = client.get(
-            f"/citas/{cita.id}",
-            headers=auth_headers_admin
-        )
-        
-        assert response.status_code == 200
-    
     def test_obtener_cita_inexistente(
         self,
         client: TestClient,
@@ -480,22 +383,13 @@ class TestCitaUpdate:
     
     def test_actualizar_cita_estado(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        veterinario_usuario: UsuarioORM,
-        mascota_instance: MascotaORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba actualizar estado de cita."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) - timedelta(days=1),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita(fecha=now_utc - timedelta(days=1))
         
         update_data = {
             "estado": "completada",
@@ -518,25 +412,16 @@ class TestCitaUpdate:
     
     def test_actualizar_cita_solo_fecha(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         cliente_usuario: UsuarioORM,
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba actualizaci�n parcial de cita."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita()
         
-        nueva_fecha = (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
+        nueva_fecha = (now_utc + timedelta(days=7)).isoformat()
         update_data = {
             "fecha": nueva_fecha
         }
@@ -551,26 +436,17 @@ class TestCitaUpdate:
     
     def test_actualizar_cita_por_no_propietario_falla(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que no propietario no puede actualizar cita."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita()
         
         # Veterinario (no propietario) intenta actualizar fecha
         update_data = {
-            "fecha": (datetime.now(timezone.utc) + timedelta(days=10)).isoformat()
+            "fecha": (now_utc + timedelta(days=10)).isoformat()
         }
         
         response = client.put(
@@ -591,20 +467,10 @@ class TestCitaCancel:
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         cliente_usuario: UsuarioORM,
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que el cliente puede cancelar su propia cita."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita()
         
         response = client.delete(
             f"/citas/{cita.id}",
@@ -620,20 +486,10 @@ class TestCitaCancel:
         self,
         client: TestClient,
         auth_headers_admin: Dict[str, str],
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que el admin puede cancelar cualquier cita."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita()
         
         response = client.delete(
             f"/citas/{cita.id}",
@@ -646,20 +502,10 @@ class TestCitaCancel:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que el veterinario no puede cancelar cita."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita()
         
         response = client.delete(
             f"/citas/{cita.id}",
@@ -673,21 +519,13 @@ class TestCitaCancel:
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         cliente_usuario: UsuarioORM,
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que cancelar una cita ya cancelada falla."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
+        cita = make_cita(
             estado="cancelada",
             is_deleted=True
         )
-        db_session.add(cita)
-        db_session.commit()
         
         response = client.delete(
             f"/citas/{cita.id}",
@@ -707,12 +545,12 @@ class TestCitaAccessControl:
         auth_headers_admin: Dict[str, str],
         cliente_usuario: UsuarioORM,
         veterinario_usuario: UsuarioORM,
-        db_session: Session
+        db_session: Session,
+        make_cita: Callable[..., CitaORM]
     ):
         """Prueba que el cliente no puede ver cita de mascota de otro usuario."""
         # Crear otra mascota para admin/otro usuario
         otra_mascota = MascotaORM(
-            id="bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb",
             nombre="Otro",
             tipo="perro",
             raza="Bulldog",
@@ -724,15 +562,7 @@ class TestCitaAccessControl:
         db_session.commit()
         
         # Crear cita para mascota de otro usuario
-        cita = CitaORM(
-            id_mascota=otra_mascota.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
+        cita = make_cita(id_mascota=otra_mascota.id)
         
         # Cliente intenta acceder
         response = client.get(
@@ -742,38 +572,29 @@ class TestCitaAccessControl:
         
         assert response.status_code == 403
     
+    @pytest.mark.parametrize(
+        "url",
+        ["/citas/00000000-0000-0000-0000-000000000000", "/citas/"],
+        ids=["obtener", "listar"]
+    )
     def test_sin_autenticacion_falla(
         self,
         client: TestClient,
-        mascota_instance: MascotaORM,
-        veterinario_usuario: UsuarioORM,
-        db_session: Session
+        url: str
     ):
         """Prueba que las solicitudes sin autenticacion fallan."""
-        cita = CitaORM(
-            id_mascota=mascota_instance.id,
-            fecha=datetime.now(timezone.utc) + timedelta(days=5),
-            motivo="Revisión",
-            veterinario=veterinario_usuario.username,
-            estado="pendiente"
-        )
-        db_session.add(cita)
-        db_session.commit()
-        
-        # Intentar obtener sin autenticacin
-        response = client.get(f"/citas/{cita.id}")
-        assert response.status_code == 401
-        
-        # Intentar listar sin autenticacin
-        response = client.get("/citas/")
+        # La autenticación se valida antes de consultar la base de datos
+        response = client.get(url)
         assert response.status_code == 401
 
 
 class TestCitaHistorial:
     """Pruebas para ver historial clinico (historial de citas)."""
     
+    @pytest.mark.slow
     def test_obtener_citas_por_mascota(
         self,
+        now_utc: datetime,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         cliente_usuario: UsuarioORM,
@@ -783,15 +604,16 @@ class TestCitaHistorial:
     ):
         """Prueba obtener todas las citas de una mascota espec�fica (historial cl�nico)."""
         # Crear mltiples citas
-        for i in range(3):
-            cita = CitaORM(
+        db_session.add_all([
+            CitaORM(
                 id_mascota=mascota_instance.id,
-                fecha=datetime.now(timezone.utc) - timedelta(days=30-i*10),
+                fecha=now_utc - timedelta(days=30-i*10),
                 motivo=f"Revisión {i}",
                 veterinario=veterinario_usuario.username,
                 estado="completada"
             )
-            db_session.add(cita)
+            for i in range(3)
+        ])
         db_session.commit()
         
         # El servicio tiene metodo get_citas_by_mascota, pero el endpoint podria no estar expuesto
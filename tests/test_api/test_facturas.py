@@ -14,10 +14,10 @@ Tests cover:
 
 import pytest
 from starlette.testclient import TestClient
-from datetime import date, timedelta, datetime
-from typing import Dict
+from typing import Callable, Dict, List
 
-from database.models import MascotaORM, UsuarioORM, CitaORM, VacunaORM
+from database.models import MascotaORM, UsuarioORM, CitaORM, VacunaORM, FacturaORM
+from tests.conftest import assert_all_equal, days_from_today_at
 
 
 class TestFacturaCreation:
@@ -107,45 +107,44 @@ class TestFacturaCreation:
         
         assert response.status_code == 403
     
-    def test_crear_factura_sin_cita_ni_vacuna_falla(
-        self,
-        client: TestClient,
-        auth_headers_veterinario: Dict[str, str]
-    ):
-        """Test creating factura without cita or vacuna fails."""
-        factura_data = {
-            "tipo_servicio": "consulta_general",
-            "descripcion": "Consulta",
-            "valor_servicio": 100.0,
-            "iva": 19.0,
-            "descuento": 0.0
-        }
-        
-        response = client.post(
-            "/facturas/",
-            json=factura_data,
-            headers=auth_headers_veterinario
-        )
-        
-        assert response.status_code == 422
-    
-    def test_crear_factura_con_cita_y_vacuna_falla(
+    @pytest.mark.parametrize(
+        "refs,mutation,expected_status",
+        [
+            ((), {}, 422),
+            (("cita", "vacuna"), {}, 422),
+            (("cita",), {"valor_servicio": -50.0}, 422),
+            (("cita",), {"descuento": -10.0}, 422),
+        ],
+        ids=[
+            "sin_cita_ni_vacuna",
+            "con_cita_y_vacuna",
+            "valor_servicio_negativo",
+            "descuento_negativo",
+        ]
+    )
+    def test_crear_factura_validaciones(
         self,
+        request: pytest.FixtureRequest,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        cita_instance: CitaORM,
-        vacuna_instance: VacunaORM
+        refs: tuple,
+        mutation: Dict[str, float],
+        expected_status: int
     ):
-        """Test creating factura with both cita and vacuna fails."""
+        """Test invalid factura payloads are rejected by validation."""
         factura_data = {
-            "id_cita": str(cita_instance.id),
-            "id_vacuna": str(vacuna_instance.id),
             "tipo_servicio": "consulta_general",
             "descripcion": "Consulta",
             "valor_servicio": 100.0,
             "iva": 19.0,
             "descuento": 0.0
         }
+        # Only the references a case needs are created
+        if "cita" in refs:
+            factura_data["id_cita"] = str(request.getfixturevalue("cita_instance").id)
+        if "vacuna" in refs:
+            factura_data["id_vacuna"] = str(request.getfixturevalue("vacuna_instance").id)
+        factura_data.update(mutation)
         
         response = client.post(
             "/facturas/",
@@ -153,55 +152,7 @@ class TestFacturaCreation:
             headers=auth_headers_veterinario
         )
         
-        assert response.status_code == 422
-    
-    def test_crear_factura_valor_servicio_invalido(
-        self,
-        client: TestClient,
-        auth_headers_veterinario: Dict[str, str],
-        cita_instance: CitaORM
-    ):
-        """Test creating factura with invalid valor_servicio."""
-        factura_data = {
-            "id_cita": str(cita_instance.id),
-            "tipo_servicio": "consulta_general",
-            "descripcion": "Consulta",
-            "valor_servicio": -50.0,  # Invalid: negative
-            "iva": 19.0,
-            "descuento": 0.0
-        }
-        
-        response = client.post(
-            "/facturas/",
-            json=factura_data,
-            headers=auth_headers_veterinario
-        )
-        
-        assert response.status_code == 422
-    
-    def test_crear_factura_descuento_negativo_falla(
-        self,
-        client: TestClient,
-        auth_headers_veterinario: Dict[str, str],
-        cita_instance: CitaORM
-    ):
-        """Test creating factura with negative descuento fails."""
-        factura_data = {
-            "id_cita": str(cita_instance.id),
-            "tipo_servicio": "consulta_general",
-            "descripcion": "Consulta",
-            "valor_servicio": 100.0,
-            "iva": 19.0,
-            "descuento": -10.0  # Invalid: negative
-        }
-        
-        response = client.post(
-            "/facturas/",
-            json=factura_data,
-            headers=auth_headers_veterinario
-        )
-        
-        assert response.status_code == 422
+        assert response.status_code == expected_status
     
     def test_crear_factura_sin_autenticacion_falla(
         self,
@@ -234,68 +185,29 @@ class TestFacturaList:
         cliente_usuario: UsuarioORM,
         veterinario_usuario: UsuarioORM,
         mascota_cliente: MascotaORM,
-        mascota_otro_cliente: MascotaORM
+        mascota_otro_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test that cliente only sees facturas for their own pets."""
         # Create citas for both mascotas
         cita1 = CitaORM(
             id_mascota=mascota_cliente.id,
-            fecha=datetime.fromisoformat((date.today() + timedelta(days=1)).isoformat() + "T10:00:00"),
+            fecha=days_from_today_at(1, 10),
             motivo="Control",
             veterinario=veterinario_usuario.username
         )
         cita2 = CitaORM(
             id_mascota=mascota_otro_cliente.id,
-            fecha=datetime.fromisoformat((date.today() + timedelta(days=2)).isoformat() + "T11:00:00"),
+            fecha=days_from_today_at(2, 11),
             motivo="Control",
             veterinario=veterinario_usuario.username
         )
-        db_session.add(cita1)
-        db_session.add(cita2)
-        db_session.commit()
-        
-        # Create facturas via API
-        from repositories.factura_repository import FacturaRepository
-        factura_repo = FacturaRepository(db_session)
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_id1 = str(uuid4())
-        factura1 = FacturaORM(
-            id=factura_id1,
-            numero_factura=generar_numero_factura_uuid(factura_id1),
-            id_cita=str(cita1.id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        
-        factura_id2 = str(uuid4())
-        factura2 = FacturaORM(
-            id=factura_id2,
-            numero_factura=generar_numero_factura_uuid(factura_id2),
-            id_cita=str(cita2.id),
-            id_mascota=mascota_otro_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
+        db_session.add_all([cita1, cita2])
+        db_session.flush()
         
-        factura_repo.create(factura1, user_id=veterinario_usuario.id)
-        factura_repo.create(factura2, user_id=veterinario_usuario.id)
-        db_session.commit()
+        # Create facturas (same transaction as the citas)
+        factura1 = make_factura(mascota_cliente, id_cita=str(cita1.id))
+        make_factura(mascota_otro_cliente, id_cita=str(cita2.id))
         
         response = client.get("/facturas/", headers=auth_headers_cliente)
         
@@ -311,36 +223,15 @@ class TestFacturaList:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_facturas: Callable[..., List[FacturaORM]]
     ):
         """Test that veterinario sees all facturas."""
         # Create multiple facturas
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        for i in range(3):
-            factura_id = str(uuid4())
-            factura = FacturaORM(
-                id=factura_id,
-                numero_factura=generar_numero_factura_uuid(factura_id),
-                id_mascota=mascota_cliente.id,
-                fecha_factura=date.today(),
-                tipo_servicio="consulta_general",
-                descripcion=f"Consulta {i}",
-                veterinario=veterinario_usuario.username,
-                valor_servicio=100.0,
-                iva=19.0,
-                descuento=0.0,
-                total=119.0
-            )
-            factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        make_facturas(
+            mascota_cliente,
+            [{"descripcion": f"Consulta {i}"} for i in range(3)]
+        )
         
         response = client.get("/facturas/", headers=auth_headers_veterinario)
         
@@ -354,7 +245,6 @@ class TestFacturaList:
         self,
         client: TestClient,
         auth_headers_admin: Dict[str, str],
-        db_session,
         veterinario_usuario: UsuarioORM,
         mascota_cliente: MascotaORM
     ):
@@ -370,54 +260,13 @@ class TestFacturaList:
         self,
         client: TestClient,
         auth_headers_admin: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test filtering facturas by estado (admin can filter)."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
         # Create facturas with different states
-        factura_id1 = str(uuid4())
-        factura1 = FacturaORM(
-            id=factura_id1,
-            numero_factura=generar_numero_factura_uuid(factura_id1),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0,
-            estado="pendiente"
-        )
-        
-        factura_id2 = str(uuid4())
-        factura2 = FacturaORM(
-            id=factura_id2,
-            numero_factura=generar_numero_factura_uuid(factura_id2),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0,
-            estado="pagada"
-        )
-        
-        factura_repo.create(factura1, user_id=veterinario_usuario.id)
-        factura_repo.create(factura2, user_id=veterinario_usuario.id)
-        db_session.commit()
+        make_factura(mascota_cliente, estado="pendiente")
+        make_factura(mascota_cliente, estado="pagada")
         
         response = client.get(
             "/facturas/?estado=pagada",
@@ -430,42 +279,21 @@ class TestFacturaList:
 
         # Should only return pagada facturas
         assert len(facturas) >= 1, f"Expected at least 1 factura, got {len(facturas)}"
-        assert all(f["estado"] == "pagada" for f in facturas)
+        assert_all_equal(facturas, "estado", "pagada")
     
     def test_listar_facturas_paginacion(
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_facturas: Callable[..., List[FacturaORM]]
     ):
         """Test pagination of facturas."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
         # Create 10 facturas
-        for i in range(10):
-            factura_id = str(uuid4())
-            factura = FacturaORM(
-                id=factura_id,
-                numero_factura=generar_numero_factura_uuid(factura_id),
-                id_mascota=mascota_cliente.id,
-                fecha_factura=date.today(),
-                tipo_servicio="consulta_general",
-                descripcion=f"Consulta {i}",
-                veterinario=veterinario_usuario.username,
-                valor_servicio=100.0,
-                iva=19.0,
-                descuento=0.0,
-                total=119.0
-            )
-            factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        make_facturas(
+            mascota_cliente,
+            [{"descripcion": f"Consulta {i}"} for i in range(10)]
+        )
         
         response = client.get(
             "/facturas/?page=0&page_size=5",
@@ -489,76 +317,30 @@ class TestFacturaGet:
         self,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
-        db_session,
         cliente_usuario: UsuarioORM,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test cliente getting factura for own pet."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
+        factura = make_factura(mascota_cliente)
         
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
-        
-        response = client.get(f"/facturas/{factura_id}", headers=auth_headers_cliente)
+        response = client.get(f"/facturas/{factura.id}", headers=auth_headers_cliente)
         
         assert response.status_code == 200
         data = response.json()
-        assert data["id_factura"] == factura_id
+        assert data["id_factura"] == factura.id
     
     def test_obtener_factura_como_veterinario(
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test veterinario can get any factura."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
+        factura = make_factura(mascota_cliente)
         
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
-        
-        response = client.get(f"/facturas/{factura_id}", headers=auth_headers_veterinario)
+        response = client.get(f"/facturas/{factura.id}", headers=auth_headers_veterinario)
         
         assert response.status_code == 200
     
@@ -579,36 +361,13 @@ class TestFacturaGet:
         self,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_otro_cliente: MascotaORM
+        mascota_otro_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test cliente cannot see factura for another's pet."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_otro_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        factura = make_factura(mascota_otro_cliente)
         
-        response = client.get(f"/facturas/{factura_id}", headers=auth_headers_cliente)
+        response = client.get(f"/facturas/{factura.id}", headers=auth_headers_cliente)
         
         assert response.status_code == 403
 
@@ -620,39 +379,16 @@ class TestFacturaUpdate:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test updating factura description."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        factura = make_factura(mascota_cliente)
         
         update_data = {"descripcion": "Consulta actualizada"}
         
         response = client.put(
-            f"/facturas/{factura_id}",
+            f"/facturas/{factura.id}",
             json=update_data,
             headers=auth_headers_veterinario
         )
@@ -665,40 +401,16 @@ class TestFacturaUpdate:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test updating factura estado."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0,
-            estado="pendiente"
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        factura = make_factura(mascota_cliente, estado="pendiente")
         
         update_data = {"estado": "pagada"}
         
         response = client.put(
-            f"/facturas/{factura_id}",
+            f"/facturas/{factura.id}",
             json=update_data,
             headers=auth_headers_veterinario
         )
@@ -711,39 +423,16 @@ class TestFacturaUpdate:
         self,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test cliente cannot update facturas."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        factura = make_factura(mascota_cliente)
         
         update_data = {"descripcion": "Updated"}
         
         response = client.put(
-            f"/facturas/{factura_id}",
+            f"/facturas/{factura.id}",
             json=update_data,
             headers=auth_headers_cliente
         )
@@ -758,39 +447,15 @@ class TestFacturaMarkAsPaid:
         self,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
-        db_session,
         cliente_usuario: UsuarioORM,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test cliente can mark own factura as paid."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0,
-            estado="pendiente"
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        factura = make_factura(mascota_cliente, estado="pendiente")
         
         response = client.post(
-            f"/facturas/{factura_id}/pagar",
+            f"/facturas/{factura.id}/pagar",
             headers=auth_headers_cliente
         )
         
@@ -802,38 +467,14 @@ class TestFacturaMarkAsPaid:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM]
     ):
         """Test veterinario can mark factura as paid."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0,
-            estado="pendiente"
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        factura = make_factura(mascota_cliente, estado="pendiente")
         
         response = client.post(
-            f"/facturas/{factura_id}/pagar",
+            f"/facturas/{factura.id}/pagar",
             headers=auth_headers_veterinario
         )
         
@@ -845,176 +486,67 @@ class TestFacturaMarkAsPaid:
 class TestFacturaAnular:
     """Tests for canceling (anulando) facturas."""
     
-    def test_anular_factura_como_admin(
+    @pytest.mark.parametrize(
+        "headers_fixture,expected_status",
+        [
+            ("auth_headers_admin", 200),
+            ("auth_headers_veterinario", 403),
+        ],
+        ids=["admin", "veterinario_falla"]
+    )
+    def test_anular_factura_por_rol(
         self,
+        request: pytest.FixtureRequest,
         client: TestClient,
-        auth_headers_admin: Dict[str, str],
-        db_session,
-        admin_usuario: UsuarioORM,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
-    ):
-        """Test admin can anular facturas."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0,
-            estado="pendiente"
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
-        
-        response = client.post(
-            f"/facturas/{factura_id}/anular",
-            headers=auth_headers_admin
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-    
-    def test_anular_factura_veterinario_falla(
-        self,
-        client: TestClient,
-        auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM],
+        headers_fixture: str,
+        expected_status: int
     ):
-        """Test veterinario cannot anular facturas."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        """Test only admin can anular facturas."""
+        factura = make_factura(mascota_cliente, estado="pendiente")
         
         response = client.post(
-            f"/facturas/{factura_id}/anular",
-            headers=auth_headers_veterinario
+            f"/facturas/{factura.id}/anular",
+            headers=request.getfixturevalue(headers_fixture)
         )
         
-        assert response.status_code == 403
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            assert response.json()["success"] is True
 
 
 class TestFacturaDelete:
     """Tests for deleting facturas (soft delete)."""
     
-    def test_eliminar_factura_como_admin(
-        self,
-        client: TestClient,
-        auth_headers_admin: Dict[str, str],
-        db_session,
-        admin_usuario: UsuarioORM,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
-    ):
-        """Test admin can delete facturas."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
-        
-        response = client.delete(
-            f"/facturas/{factura_id}",
-            headers=auth_headers_admin
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-    
-    def test_eliminar_factura_veterinario_falla(
+    @pytest.mark.parametrize(
+        "headers_fixture,expected_status",
+        [
+            ("auth_headers_admin", 200),
+            ("auth_headers_veterinario", 403),
+        ],
+        ids=["admin", "veterinario_falla"]
+    )
+    def test_eliminar_factura_por_rol(
         self,
+        request: pytest.FixtureRequest,
         client: TestClient,
-        auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario: UsuarioORM,
-        mascota_cliente: MascotaORM
+        mascota_cliente: MascotaORM,
+        make_factura: Callable[..., FacturaORM],
+        headers_fixture: str,
+        expected_status: int
     ):
-        """Test veterinario cannot delete facturas."""
-        from repositories.factura_repository import FacturaRepository
-        from database.models import FacturaORM
-        from database.db import generar_numero_factura_uuid
-        from uuid import uuid4
-        
-        factura_repo = FacturaRepository(db_session)
-        
-        factura_id = str(uuid4())
-        factura = FacturaORM(
-            id=factura_id,
-            numero_factura=generar_numero_factura_uuid(factura_id),
-            id_mascota=mascota_cliente.id,
-            fecha_factura=date.today(),
-            tipo_servicio="consulta_general",
-            descripcion="Consulta",
-            veterinario=veterinario_usuario.username,
-            valor_servicio=100.0,
-            iva=19.0,
-            descuento=0.0,
-            total=119.0
-        )
-        factura_repo.create(factura, user_id=veterinario_usuario.id)
-        db_session.commit()
+        """Test only admin can delete facturas."""
+        factura = make_factura(mascota_cliente)
         
         response = client.delete(
-            f"/facturas/{factura_id}",
-            headers=auth_headers_veterinario
+            f"/facturas/{factura.id}",
+            headers=request.getfixturevalue(headers_fixture)
         )
         
-        assert response.status_code == 403
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            assert response.json()["success"] is True
 
 
 class TestFacturaAccessControl:
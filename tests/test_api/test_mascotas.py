@@ -12,11 +12,12 @@ Tests cover:
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 
 from database.models import UsuarioORM, MascotaORM
-from tests.conftest import assert_valid_uuid, assert_datetime_format
+from tests.conftest import assert_valid_uuid, assert_datetime_format, assert_all_equal
 
 
 class TestMascotaCreation:
@@ -182,23 +183,11 @@ class TestMascotaList:
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
         mascota_instance: MascotaORM,
-        db_session: Session,
+        vet_mascota: MascotaORM,
         veterinario_usuario: UsuarioORM
     ):
         """Test cliente only sees their own mascotas."""
-        # Create a mascota for veterinario
-        vet_mascota = MascotaORM(
-            nombre="Mascota del Vet",
-            tipo="perro",
-            raza="Bulldog",
-            edad=2,
-            peso=15.0,
-            propietario=veterinario_usuario.username
-        )
-        db_session.add(vet_mascota)
-        db_session.commit()
-        
-        # Cliente should only see their mascota
+        # Cliente should only see their mascota, not the veterinario's
         response = client.get("/mascotas/", headers=auth_headers_cliente)
         
         assert response.status_code == 200
@@ -213,22 +202,10 @@ class TestMascotaList:
         client: TestClient,
         auth_headers_admin: Dict[str, str],
         mascota_instance: MascotaORM,
-        db_session: Session,
-        veterinario_usuario: UsuarioORM
+        vet_mascota: MascotaORM
     ):
         """Test admin can see all mascotas."""
-        # Create mascotas for different users
-        vet_mascota = MascotaORM(
-            nombre="Mascota del Vet",
-            tipo="perro",
-            raza="Bulldog",
-            edad=2,
-            peso=15.0,
-            propietario=veterinario_usuario.username
-        )
-        db_session.add(vet_mascota)
-        db_session.commit()
-        
+        # mascota_instance and vet_mascota belong to different users
         response = client.get("/mascotas/", headers=auth_headers_admin)
         
         assert response.status_code == 200
@@ -257,7 +234,7 @@ class TestMascotaList:
             propietario=cliente_usuario.username
         )
         db_session.add(gato)
-        db_session.commit()
+        db_session.flush()
         
         # Filter by perro
         response = client.get(
@@ -269,8 +246,7 @@ class TestMascotaList:
         data = response.json()
         
         # All returned mascotas should be perros
-        for mascota in data["data"]:
-            assert mascota["tipo"] == "perro"
+        assert_all_equal(data["data"], "tipo", "perro")
     
     def test_listar_mascotas_paginacion(
         self,
@@ -280,18 +256,18 @@ class TestMascotaList:
         cliente_usuario: UsuarioORM
     ):
         """Test pagination works correctly."""
-        # Create multiple mascotas
-        for i in range(10):
-            mascota = MascotaORM(
-                nombre=f"Mascota{i}",
-                tipo="perro",
-                raza="Labrador",
-                edad=i,
-                peso=10.0 + i,
-                propietario=cliente_usuario.username
-            )
-            db_session.add(mascota)
-        db_session.commit()
+        # Create multiple mascotas (bulk INSERT, no per-object unit of work)
+        db_session.execute(insert(MascotaORM), [
+            {
+                "nombre": f"Mascota{i}",
+                "tipo": "perro",
+                "raza": "Labrador",
+                "edad": i,
+                "peso": 10.0 + i,
+                "propietario": cliente_usuario.username
+            }
+            for i in range(10)
+        ])
         
         # Test first page
         response = client.get(
@@ -323,8 +299,7 @@ class TestMascotaList:
         data = response.json()
         
         # All returned mascotas should belong to the specified owner
-        for mascota in data["data"]:
-            assert mascota["propietario"] == cliente_usuario.username
+        assert_all_equal(data["data"], "propietario", cliente_usuario.username)
 
 
 class TestMascotaSearch:
@@ -378,18 +353,18 @@ class TestMascotaSearch:
         cliente_usuario: UsuarioORM
     ):
         """Test search respects limit parameter."""
-        # Create many mascotas
-        for i in range(25):
-            mascota = MascotaORM(
-                nombre=f"Firulais{i}",
-                tipo="perro",
-                raza="Labrador",
-                edad=2,
-                peso=10.0,
-                propietario=cliente_usuario.username
-            )
-            db_session.add(mascota)
-        db_session.commit()
+        # Create many mascotas (bulk INSERT, no per-object unit of work)
+        db_session.execute(insert(MascotaORM), [
+            {
+                "nombre": f"Firulais{i}",
+                "tipo": "perro",
+                "raza": "Labrador",
+                "edad": 2,
+                "peso": 10.0,
+                "propietario": cliente_usuario.username
+            }
+            for i in range(25)
+        ])
         
         # Search with limit
         response = client.get(
@@ -683,8 +658,7 @@ class TestMascotaDelete:
             is_deleted=True
         )
         db_session.add(mascota)
-        db_session.commit()
-        db_session.refresh(mascota)
+        db_session.flush()
         
         # Restore the mascota
         response = client.post(
@@ -716,8 +690,7 @@ class TestMascotaDelete:
             is_deleted=True
         )
         db_session.add(mascota)
-        db_session.commit()
-        db_session.refresh(mascota)
+        db_session.flush()
         
         # Restore as admin
         response = client.post(
@@ -737,22 +710,9 @@ class TestMascotaAccessControl:
         self,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
-        db_session: Session,
-        veterinario_usuario: UsuarioORM
+        vet_mascota: MascotaORM
     ):
         """Test cliente cannot see other users' mascotas in list."""
-        # Create mascota for another user
-        other_mascota = MascotaORM(
-            nombre="Mascota de Otro",
-            tipo="perro",
-            raza="Bulldog",
-            edad=2,
-            peso=15.0,
-            propietario=veterinario_usuario.username
-        )
-        db_session.add(other_mascota)
-        db_session.commit()
-        
         # List mascotas as cliente
         response = client.get("/mascotas/", headers=auth_headers_cliente)
         
@@ -761,7 +721,7 @@ class TestMascotaAccessControl:
 
         # Verify other user's mascota is not in the list
         mascota_ids = [m["id_mascota"] for m in data["data"]]
-        assert other_mascota.id not in mascota_ids
+        assert vet_mascota.id not in mascota_ids
     
     def test_veterinario_puede_crear_mascota_propia(
         self,
@@ -10,12 +10,16 @@ Tests cover:
 """
 
 import pytest
-from datetime import datetime, date, timedelta
-from typing import Dict
+from datetime import datetime
+from typing import Callable, Dict, List
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
-from database.models import RecetaORM, RecetaLineaORM
+from sqlalchemy import event
+from database.models import RecetaORM, RecetaLineaORM, CitaORM
+from repositories.receta_repository import RecetaRepository
+from repositories.cita_repository import CitaRepository
+from tests.conftest import days_from_today_at
 
 
 class TestRecetaCreation:
@@ -141,24 +145,11 @@ class TestRecetaList:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test veterinario can list recetas."""
-        from repositories.receta_repository import RecetaRepository
-        receta_repo = RecetaRepository(db_session)
-        
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Test",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        make_receta(cita_instance)
         
         response = client.get("/recetas/", headers=auth_headers_veterinario)
         
@@ -171,25 +162,12 @@ class TestRecetaList:
         self,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
-        db_session,
         cliente_usuario,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test cliente only sees their own recetas."""
-        from repositories.receta_repository import RecetaRepository
-        
-        receta_repo = RecetaRepository(db_session)
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Cliente receta",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        make_receta(cita_instance, indicaciones="Cliente receta")
         
         response = client.get("/recetas/", headers=auth_headers_cliente)
         
@@ -201,31 +179,57 @@ class TestRecetaList:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_recetas: Callable[..., List[RecetaORM]]
     ):
         """Test pagination of recetas list."""
-        from repositories.receta_repository import RecetaRepository
-        receta_repo = RecetaRepository(db_session)
-        
-        for i in range(5):
-            receta_id = str(uuid4())
-            receta = RecetaORM(
-                id=receta_id,
-                id_cita=str(cita_instance.id),
-                fecha_emision=datetime.now(),
-                indicaciones=f"Test {i}",
-                veterinario=veterinario_usuario.username
-            )
-            receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        make_recetas(cita_instance, [{"indicaciones": f"Test {i}"} for i in range(5)])
         
         response = client.get("/recetas/?limit=2", headers=auth_headers_veterinario)
         
         assert response.status_code == 200
         data = response.json()
         assert "pagination" in data
+    
+    def test_listar_recetas_consultas_constantes(
+        self,
+        client: TestClient,
+        auth_headers_admin: Dict[str, str],
+        db_session,
+        cita_instance,
+        make_cita: Callable[..., CitaORM],
+        mascota_otro_cliente,
+        make_recetas: Callable[..., List[RecetaORM]]
+    ):
+        """Test the list endpoint issues the same number of queries for any page size (no N+1)."""
+        otra_cita = make_cita(id_mascota=mascota_otro_cliente.id)
+        for cita in (cita_instance, otra_cita):
+            make_recetas(cita, [{"indicaciones": f"Test {i}"} for i in range(5)])
+        
+        engine = db_session.get_bind().engine
+        statements = []
+        
+        def count_queries(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+        
+        def queries_for(page_size: int) -> int:
+            statements.clear()
+            response = client.get(
+                f"/recetas/?page_size={page_size}",
+                headers=auth_headers_admin
+            )
+            assert response.status_code == 200
+            assert len(response.json()["data"]) == page_size
+            return len(statements)
+        
+        event.listen(engine, "before_cursor_execute", count_queries)
+        try:
+            small, large = queries_for(2), queries_for(10)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_queries)
+        
+        assert small == large
 
 
 class TestRecetaGet:
@@ -235,24 +239,11 @@ class TestRecetaGet:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test getting receta by cita ID."""
-        from repositories.receta_repository import RecetaRepository
-        receta_repo = RecetaRepository(db_session)
-        
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Test",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        make_receta(cita_instance)
         
         response = client.get(f"/recetas/cita/{cita_instance.id}", headers=auth_headers_veterinario)
         
@@ -264,30 +255,17 @@ class TestRecetaGet:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test getting receta by ID."""
-        from repositories.receta_repository import RecetaRepository
-        receta_repo = RecetaRepository(db_session)
-        
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Test",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        receta = make_receta(cita_instance)
         
-        response = client.get(f"/recetas/{receta_id}", headers=auth_headers_veterinario)
+        response = client.get(f"/recetas/{receta.id}", headers=auth_headers_veterinario)
         
         assert response.status_code == 200
         data = response.json()
-        assert data["id_receta"] == receta_id
+        assert data["id_receta"] == receta.id
 
     def test_obtener_receta_no_existe(
         self,
@@ -306,39 +284,26 @@ class TestRecetaGet:
         auth_headers_cliente: Dict[str, str],
         db_session,
         veterinario_usuario,
-        mascota_otro_cliente
+        mascota_otro_cliente,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test cliente cannot see receta for another client's pet."""
-        from repositories.receta_repository import RecetaRepository
-        from repositories.cita_repository import CitaRepository
-        from database.models import CitaORM
-        
         # Create a cita for the other client's mascota
         cita_repo = CitaRepository(db_session)
         cita_id = str(uuid4())
         cita = CitaORM(
             id=cita_id,
             id_mascota=mascota_otro_cliente.id,
-            fecha=datetime.fromisoformat((date.today() + timedelta(days=1)).isoformat() + "T10:00:00"),
+            fecha=days_from_today_at(1, 10),
             motivo="Control de rutina",
             veterinario=veterinario_usuario.username,
         )
         cita_repo.create(cita, user_id=veterinario_usuario.id)
         db_session.commit()
         
-        receta_repo = RecetaRepository(db_session)
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=cita_id,
-            fecha_emision=datetime.now(),
-            indicaciones="Test",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        receta = make_receta(cita)
         
-        response = client.get(f"/recetas/{receta_id}", headers=auth_headers_cliente)
+        response = client.get(f"/recetas/{receta.id}", headers=auth_headers_cliente)
         
         # Should be 403 if cliente doesn't own the pet
         assert response.status_code in [403, 404]
@@ -351,30 +316,17 @@ class TestRecetaUpdate:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test updating receta indicaciones."""
-        from repositories.receta_repository import RecetaRepository
-        receta_repo = RecetaRepository(db_session)
-        
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Original",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        receta = make_receta(cita_instance, indicaciones="Original")
         
         update_data = {
             "indicaciones": "Actualizado"
         }
         
-        response = client.put(f"/recetas/{receta_id}", json=update_data, headers=auth_headers_veterinario)
+        response = client.put(f"/recetas/{receta.id}", json=update_data, headers=auth_headers_veterinario)
         
         assert response.status_code == 200
         data = response.json()
@@ -389,7 +341,6 @@ class TestRecetaUpdate:
         cita_instance
     ):
         """Test updating receta lineas."""
-        from repositories.receta_repository import RecetaRepository
         receta_repo = RecetaRepository(db_session)
         
         receta_id = str(uuid4())
@@ -411,7 +362,7 @@ class TestRecetaUpdate:
             ]
         }
         
-        response = client.put(f"/recetas/{receta_id}", json=update_data, headers=auth_headers_veterinario)
+        response = client.put(f"/recetas/{receta.id}", json=update_data, headers=auth_headers_veterinario)
         
         assert response.status_code == 200
         data = response.json()
@@ -421,28 +372,15 @@ class TestRecetaUpdate:
         self,
         client: TestClient,
         auth_headers_cliente: Dict[str, str],
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test cliente cannot update receta."""
-        from repositories.receta_repository import RecetaRepository
-        
-        receta_repo = RecetaRepository(db_session)
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Test",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        receta = make_receta(cita_instance)
         
         update_data = {"indicaciones": "Updated"}
         
-        response = client.put(f"/recetas/{receta_id}", json=update_data, headers=auth_headers_cliente)
+        response = client.put(f"/recetas/{receta.id}", json=update_data, headers=auth_headers_cliente)
         
         assert response.status_code == 403
 
@@ -454,26 +392,13 @@ class TestRecetaDelete:
         self,
         client: TestClient,
         auth_headers_admin: Dict[str, str],
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test admin can delete receta."""
-        from repositories.receta_repository import RecetaRepository
-        receta_repo = RecetaRepository(db_session)
+        receta = make_receta(cita_instance)
         
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Test",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
-        
-        response = client.delete(f"/recetas/{receta_id}", headers=auth_headers_admin)
+        response = client.delete(f"/recetas/{receta.id}", headers=auth_headers_admin)
         
         assert response.status_code == 200
 
@@ -481,51 +406,25 @@ class TestRecetaDelete:
         self,
         client: TestClient,
         auth_headers_veterinario: Dict[str, str],
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test veterinario cannot delete receta."""
-        from repositories.receta_repository import RecetaRepository
-        receta_repo = RecetaRepository(db_session)
+        receta = make_receta(cita_instance)
         
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Test",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
-        
-        response = client.delete(f"/recetas/{receta_id}", headers=auth_headers_veterinario)
+        response = client.delete(f"/recetas/{receta.id}", headers=auth_headers_veterinario)
         
         assert response.status_code == 403
 
     def test_eliminar_receta_sin_autenticacion_falla(
         self,
         client: TestClient,
-        db_session,
-        veterinario_usuario,
-        cita_instance
+        cita_instance,
+        make_receta: Callable[..., RecetaORM]
     ):
         """Test unauthenticated user cannot delete receta."""
-        from repositories.receta_repository import RecetaRepository
-        receta_repo = RecetaRepository(db_session)
-        
-        receta_id = str(uuid4())
-        receta = RecetaORM(
-            id=receta_id,
-            id_cita=str(cita_instance.id),
-            fecha_emision=datetime.now(),
-            indicaciones="Test",
-            veterinario=veterinario_usuario.username
-        )
-        receta_repo.create(receta, user_id=veterinario_usuario.id)
-        db_session.commit()
+        receta = make_receta(cita_instance)
         
-        response = client.delete(f"/recetas/{receta_id}")
+        response = client.delete(f"/recetas/{receta.id}")
         
         assert response.status_code == 401
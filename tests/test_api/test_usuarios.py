@@ -15,7 +15,25 @@ from sqlalchemy.orm import Session
 from typing import Dict, Any
 
 from database.models import UsuarioORM
-from tests.conftest import assert_valid_uuid, assert_datetime_format
+from services.usuario_service import UsuarioService
+from tests.conftest import assert_valid_uuid, assert_datetime_format, assert_all_equal
+
+
+@pytest.fixture
+def export_session(db_session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Open the export's own session on the test connection.
+    
+    /usuarios/export no usa get_db sino SessionLocal(); aquí se reemplaza
+    por sesiones sobre la misma conexión de db_session para que vean los
+    datos del test y se reviertan con él.
+    """
+    monkeypatch.setattr(
+        "routes.usuarios.SessionLocal",
+        lambda: Session(
+            bind=db_session.connection(),
+            join_transaction_mode="create_savepoint",
+        ),
+    )
 
 
 class TestUsuarioRegistration:
@@ -265,8 +283,7 @@ class TestUsuarioList:
         data = response.json()
         
         # Verify all returned users are clientes
-        for usuario in data["data"]:
-            assert usuario["role"] == "cliente"
+        assert_all_equal(data["data"], "role", "cliente")
     
     def test_listar_usuarios_paginacion(
         self,
@@ -320,6 +337,64 @@ class TestUsuarioList:
         """Test cliente cannot list all users."""
         response = client.get("/usuarios/", headers=auth_headers_cliente)
         assert response.status_code == 403
+    
+    def test_exportar_usuarios_ndjson(
+        self,
+        client: TestClient,
+        export_session: None,
+        auth_headers_admin: Dict[str, str],
+        cliente_usuario: UsuarioORM,
+        veterinario_usuario: UsuarioORM
+    ):
+        """Test admin export streams one JSON object per line."""
+        import json
+        
+        response = client.get(
+            "/usuarios/export?role=cliente",
+            headers=auth_headers_admin
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        usernames = [row["username"] for row in rows]
+        assert cliente_usuario.username in usernames
+        assert veterinario_usuario.username not in usernames
+        assert usernames == sorted(usernames)
+    
+    def test_exportar_usuarios_error_durante_stream(
+        self,
+        client: TestClient,
+        export_session: None,
+        auth_headers_admin: Dict[str, str],
+        cliente_usuario: UsuarioORM,
+        monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a DB error mid-stream ends the body with an error line."""
+        import json
+        
+        def iter_usuarios_falla(self, role=None, include_deleted=False):
+            yield {"username": cliente_usuario.username}
+            raise RuntimeError("conexión perdida")
+        
+        monkeypatch.setattr(UsuarioService, "iter_usuarios", iter_usuarios_falla)
+        
+        response = client.get("/usuarios/export", headers=auth_headers_admin)
+        
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows[0] == {"username": cliente_usuario.username}
+        assert rows[-1] == {"error": "Error al exportar usuarios"}
+    
+    def test_exportar_usuarios_como_cliente_falla(
+        self,
+        client: TestClient,
+        auth_headers_cliente: Dict[str, str]
+    ):
+        """Test cliente cannot export users."""
+        response = client.get("/usuarios/export", headers=auth_headers_cliente)
+        assert response.status_code == 403
 
 
 class TestUsuarioGet:
@@ -471,6 +546,42 @@ class TestUsuarioUpdate:
         )
         
         assert response.status_code == 400
+    
+    def test_actualizar_usuario_sin_cambios(
+        self,
+        client: TestClient,
+        auth_headers_cliente: Dict[str, str],
+        cliente_usuario: UsuarioORM
+    ):
+        """Test empty update returns current data unchanged."""
+        response = client.put(
+            "/usuarios/me",
+            json={},
+            headers=auth_headers_cliente
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["username"] == cliente_usuario.username
+        assert data["nombre"] == cliente_usuario.nombre
+    
+    def test_actualizar_usuario_mismo_username(
+        self,
+        client: TestClient,
+        auth_headers_cliente: Dict[str, str],
+        cliente_usuario: UsuarioORM
+    ):
+        """Test sending the current username is not treated as duplicate."""
+        response = client.put(
+            "/usuarios/me",
+            json={"username": cliente_usuario.username, "edad": 40},
+            headers=auth_headers_cliente
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["username"] == cliente_usuario.username
+        assert data["edad"] == 40
 
 
 class TestUsuarioDelete:
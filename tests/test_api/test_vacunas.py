@@ -13,12 +13,14 @@ Tests cover:
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 from datetime import date, timedelta
 
 from database.models import VacunaORM, UsuarioORM, MascotaORM
-from tests.conftest import assert_valid_uuid
+from config import settings
+from tests.conftest import assert_valid_uuid, assert_all_equal
 
 
 class TestVacunaCreation:
@@ -224,8 +226,7 @@ class TestVacunaList:
         assert "pagination" in data
         
         # All returned vacunas should be for their pets
-        for vac in data["data"]:
-            assert vac["propietario_username"] == cliente_usuario.username
+        assert_all_equal(data["data"], "propietario_username", cliente_usuario.username)
     
     def test_listar_vacunas_veterinario_ve_todas(
         self,
@@ -313,8 +314,7 @@ class TestVacunaList:
         data = response.json()
         
         # All returned vaccines should be rabia type
-        for vac in data["data"]:
-            assert vac["tipo_vacuna"] == "rabia"
+        assert_all_equal(data["data"], "tipo_vacuna", "rabia")
     
     def test_listar_vacunas_paginacion(
         self,
@@ -349,6 +349,239 @@ class TestVacunaList:
         assert len(data["data"]) <= 5
         assert pagination["page"] == 0
         assert pagination["page_size"] == 5
+        assert pagination["is_estimate"] is False
+    
+    def test_listar_vacunas_total_en_el_umbral_es_exacto(
+        self,
+        client: TestClient,
+        auth_headers_admin: Dict[str, str],
+        mascota_instance: MascotaORM,
+        veterinario_usuario: UsuarioORM,
+        db_session: Session,
+        monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a total equal to the threshold is exact; only above it is an estimate."""
+        monkeypatch.setattr(settings, "simple_pagination_threshold", 4)
+        vacunas = [
+            VacunaORM(
+                id_mascota=mascota_instance.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=i),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(vacunas[:4])
+        db_session.commit()
+        
+        response = client.get("/vacunas/", headers=auth_headers_admin)
+        pagination = response.json()["pagination"]
+        assert pagination["total_items"] == 4
+        assert pagination["is_estimate"] is False
+        
+        db_session.add(vacunas[4])
+        db_session.commit()
+        
+        response = client.get("/vacunas/", headers=auth_headers_admin)
+        pagination = response.json()["pagination"]
+        assert pagination["total_items"] == 5
+        assert pagination["is_estimate"] is True
+    
+    def test_listar_vacunas_paginacion_cursor(
+        self,
+        client: TestClient,
+        auth_headers_admin: Dict[str, str],
+        mascota_instance: MascotaORM,
+        veterinario_usuario: UsuarioORM,
+        db_session: Session
+    ):
+        """Test keyset pagination walks every vacuna exactly once."""
+        # Two vaccines per day so the id tiebreaker is exercised
+        for i in range(7):
+            vacuna = VacunaORM(
+                id_mascota=mascota_instance.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=i // 2),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username
+            )
+            db_session.add(vacuna)
+        db_session.commit()
+        
+        seen = []
+        params = {"page_size": 3}
+        while True:
+            response = client.get("/vacunas/", params=params, headers=auth_headers_admin)
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(item["id_vacuna"] for item in data["data"])
+            if data["next_cursor"] is None:
+                break
+            params = {"page_size": 3, **data["next_cursor"]}
+        
+        assert len(seen) == 7
+        assert len(set(seen)) == 7
+    
+    def test_listar_vacunas_cursor_ultima_pagina_completa(
+        self,
+        client: TestClient,
+        auth_headers_admin: Dict[str, str],
+        mascota_instance: MascotaORM,
+        veterinario_usuario: UsuarioORM,
+        db_session: Session
+    ):
+        """Test an exactly full last page returns a null next_cursor."""
+        for i in range(6):
+            vacuna = VacunaORM(
+                id_mascota=mascota_instance.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=i),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username
+            )
+            db_session.add(vacuna)
+        db_session.commit()
+        
+        response = client.get("/vacunas/", params={"page_size": 3}, headers=auth_headers_admin)
+        data = response.json()
+        assert data["pagination"]["has_next"] is True
+        assert data["next_cursor"] is not None
+        
+        response = client.get(
+            "/vacunas/",
+            params={"page_size": 3, **data["next_cursor"]},
+            headers=auth_headers_admin
+        )
+        assert response.status_code == 200
+        data = response.json()
+        pagination = data["pagination"]
+        
+        assert len(data["data"]) == 3
+        assert data["next_cursor"] is None
+        assert pagination["has_next"] is False
+        assert pagination["total_items"] == 6
+        assert "page" not in pagination
+        assert "total_pages" not in pagination
+    
+    def test_listar_vacunas_consultas_constantes(
+        self,
+        client: TestClient,
+        auth_headers_admin: Dict[str, str],
+        mascota_instance: MascotaORM,
+        mascota_otro_cliente: MascotaORM,
+        veterinario_usuario: UsuarioORM,
+        db_session: Session
+    ):
+        """Test the list endpoint issues the same number of queries for any page size (no N+1)."""
+        for i in range(10):
+            vacuna = VacunaORM(
+                id_mascota=(mascota_instance if i % 2 else mascota_otro_cliente).id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=i),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username
+            )
+            db_session.add(vacuna)
+        db_session.commit()
+        
+        engine = db_session.get_bind().engine
+        statements = []
+        
+        def count_queries(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+        
+        def queries_for(page_size: int) -> int:
+            statements.clear()
+            response = client.get(
+                f"/vacunas/?page_size={page_size}",
+                headers=auth_headers_admin
+            )
+            assert response.status_code == 200
+            assert len(response.json()["data"]) == page_size
+            return len(statements)
+        
+        event.listen(engine, "before_cursor_execute", count_queries)
+        try:
+            queries_for(1)  # warm-up: reloads objects expired by the commit
+            small, large = queries_for(2), queries_for(10)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_queries)
+        
+        assert small == large
+    
+    def test_listar_vacunas_filtro_id_mascota(
+        self,
+        client: TestClient,
+        auth_headers_admin: Dict[str, str],
+        mascota_instance: MascotaORM,
+        mascota_otro_cliente: MascotaORM,
+        veterinario_usuario: UsuarioORM,
+        db_session: Session
+    ):
+        """Test filtering only by id_mascota returns that mascota's vacunas."""
+        for i, mascota in enumerate([mascota_instance, mascota_instance, mascota_otro_cliente]):
+            db_session.add(VacunaORM(
+                id_mascota=mascota.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=i),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username
+            ))
+        db_session.commit()
+        
+        response = client.get(
+            f"/vacunas/?id_mascota={mascota_instance.id}",
+            headers=auth_headers_admin
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["pagination"]["total_items"] == 2
+        assert {v["id_mascota"] for v in data["data"]} == {mascota_instance.id}
+        assert data["data"][0]["mascota_nombre"] == mascota_instance.nombre
+    
+    def test_listar_vacunas_filtro_id_mascota_ajena_cliente(
+        self,
+        client: TestClient,
+        auth_headers_cliente: Dict[str, str],
+        mascota_otro_cliente: MascotaORM,
+        veterinario_usuario: UsuarioORM,
+        db_session: Session
+    ):
+        """Test cliente filtering by another owner's mascota gets nothing."""
+        db_session.add(VacunaORM(
+            id_mascota=mascota_otro_cliente.id,
+            tipo_vacuna="rabia",
+            fecha_aplicacion=date.today(),
+            lote_vacuna="LOTE000001",
+            veterinario=veterinario_usuario.username
+        ))
+        db_session.commit()
+        
+        response = client.get(
+            f"/vacunas/?id_mascota={mascota_otro_cliente.id}",
+            headers=auth_headers_cliente
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"] == []
+        assert data["pagination"]["total_items"] == 0
+    
+    def test_listar_vacunas_cursor_incompleto_falla(
+        self,
+        client: TestClient,
+        auth_headers_admin: Dict[str, str]
+    ):
+        """Test after_fecha without after_id is rejected."""
+        response = client.get(
+            f"/vacunas/?after_fecha={date.today().isoformat()}",
+            headers=auth_headers_admin
+        )
+        
+        assert response.status_code == 422
 
 
 class TestVacunaGet:
@@ -688,6 +921,37 @@ class TestVacunaProximasDosis:
         
         assert isinstance(data, (dict, list))
     
+    def test_obtener_proximas_dosis_cliente_solo_propias(
+        self,
+        client: TestClient,
+        auth_headers_cliente: Dict[str, str],
+        mascota_instance: MascotaORM,
+        mascota_otro_cliente: MascotaORM,
+        veterinario_usuario: UsuarioORM,
+        db_session: Session
+    ):
+        """Test cliente upcoming doses exclude other owners' mascotas."""
+        for i, mascota in enumerate([mascota_instance, mascota_otro_cliente]):
+            db_session.add(VacunaORM(
+                id_mascota=mascota.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=365),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username,
+                proxima_dosis=date.today() + timedelta(days=30 + i)
+            ))
+        db_session.commit()
+        
+        response = client.get(
+            "/vacunas/proximas-dosis",
+            headers=auth_headers_cliente
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        items = data["data"] if isinstance(data, dict) else data
+        assert [v["id_mascota"] for v in items] == [mascota_instance.id]
+    
     def test_obtener_proximas_dosis_con_fecha_limite(
         self,
         client: TestClient,
@@ -175,6 +175,23 @@ class TestCitaRepositoryRead:
         with pytest.raises(NotFoundException):
             repo.get_by_id_or_fail("00000000-0000-0000-0000-000000000000")
     
+    def test_get_by_ids(
+        self,
+        db_session: Session,
+        cita_instance: CitaORM,
+        make_cita
+    ):
+        """Test get_by_ids returns a dict keyed by id, skipping unknown ids."""
+        repo = CitaRepository(db_session)
+        otra_cita = make_cita(motivo="Vacunación")
+        fake_id = "00000000-0000-0000-0000-000000000000"
+        
+        citas = repo.get_by_ids([cita_instance.id, otra_cita.id, fake_id])
+        
+        assert set(citas) == {cita_instance.id, otra_cita.id}
+        assert citas[otra_cita.id].motivo == "Vacunación"
+        assert repo.get_by_ids([]) == {}
+    
     def test_find_by_mascota(
         self,
         db_session: Session,
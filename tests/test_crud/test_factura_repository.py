@@ -11,6 +11,7 @@ Tests cover:
 """
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from datetime import date
 from typing import List
@@ -119,6 +120,50 @@ class TestFacturaRepositoryCreate:
         
         assert created.id_cita == str(cita_instance.id)
 
+    
+    def test_create_many_un_solo_insert(
+        self,
+        db_session: Session,
+        mascota_instance: MascotaORM,
+        veterinario_usuario: UsuarioORM
+    ):
+        """Test create_many inserts a batch with audit fields in one statement."""
+        repo = FacturaRepository(db_session)
+        facturas = []
+        for i in range(3):
+            factura_id = str(uuid4())
+            facturas.append(FacturaORM(
+                id=factura_id,
+                numero_factura=generar_numero_factura_uuid(factura_id),
+                id_mascota=mascota_instance.id,
+                fecha_factura=date.today(),
+                tipo_servicio="consulta_general",
+                descripcion=f"Consulta {i}",
+                veterinario=veterinario_usuario.username,
+                valor_servicio=100.0,
+                iva=19.0,
+                descuento=0.0,
+                total=119.0
+            ))
+        
+        inserts = []
+        
+        def count_inserts(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement)
+        
+        engine = db_session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", count_inserts)
+        try:
+            created = repo.create_many(facturas, user_id=veterinario_usuario.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_inserts)
+        
+        assert len(inserts) == 1
+        assert created == facturas
+        assert all(f.id_usuario_creacion == veterinario_usuario.id for f in created)
+        assert repo.count() == 3
+
 
 class TestFacturaRepositoryRead:
     """Tests for reading facturas."""
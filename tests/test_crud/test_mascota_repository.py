@@ -122,6 +122,22 @@ class TestMascotaRepositoryRead:
         with pytest.raises(NotFoundException):
             mascota_repository.get_by_id_or_fail(fake_id)
     
+    def test_get_by_ids(
+        self,
+        mascota_repository: MascotaRepository,
+        mascota_instance: MascotaORM,
+        mascota_otro_cliente: MascotaORM
+    ):
+        """Test get_by_ids returns a dict keyed by id, skipping unknown ids."""
+        fake_id = "00000000-0000-0000-0000-000000000000"
+        mascotas = mascota_repository.get_by_ids(
+            [mascota_instance.id, mascota_otro_cliente.id, fake_id]
+        )
+        
+        assert set(mascotas) == {mascota_instance.id, mascota_otro_cliente.id}
+        assert mascotas[mascota_otro_cliente.id].nombre == mascota_otro_cliente.nombre
+        assert mascota_repository.get_by_ids([]) == {}
+    
     def test_find_by_propietario(
         self,
         mascota_repository: MascotaRepository,
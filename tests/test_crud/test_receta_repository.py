@@ -11,6 +11,7 @@ Tests cover:
 
 import pytest
 from datetime import datetime
+from sqlalchemy.exc import InvalidRequestError
 from uuid import uuid4
 
 from repositories.receta_repository import RecetaRepository
@@ -219,6 +220,36 @@ class TestRecetaRepositoryRead:
         
         assert len(recetas) >= 3
 
+    def test_find_by_veterinario_no_carga_lineas(
+        self,
+        db_session,
+        veterinario_usuario,
+        cita_instance
+    ):
+        """Test list queries raise on lazy lineas access instead of issuing N+1 SELECTs."""
+        receta_repo = RecetaRepository(db_session)
+        
+        receta_id = str(uuid4())
+        receta = RecetaORM(
+            id=receta_id,
+            id_cita=str(cita_instance.id),
+            fecha_emision=datetime.now(),
+            indicaciones="Test",
+            veterinario=veterinario_usuario.username
+        )
+        lineas = [RecetaLineaORM(medicamento="Amoxicilina", dosis="250mg")]
+        receta_repo.create_with_lineas(receta, lineas, user_id=veterinario_usuario.id)
+        db_session.commit()
+        db_session.expire_all()
+        
+        recetas = receta_repo.find_by_veterinario(veterinario_usuario.username)
+        
+        with pytest.raises(InvalidRequestError):
+            recetas[0].lineas
+        
+        # The detail query still loads them eagerly
+        assert len(receta_repo.get_by_id_with_lineas(receta_id).lineas) == 1
+
     def test_find_by_mascota(
         self,
         db_session,
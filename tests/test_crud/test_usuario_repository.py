@@ -14,7 +14,7 @@ import pytest
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 
-from database.models import UsuarioORM
+from database.models import UsuarioORM, MascotaORM
 from repositories.usuario_repository import UsuarioRepository
 from database.db import hash_password
 from core.exceptions import NotFoundException, DatabaseException
@@ -147,6 +147,24 @@ class TestUsuarioRepositoryRead:
         
         assert usuario is None
     
+    def test_get_by_usernames(
+        self,
+        usuario_repository: UsuarioRepository,
+        cliente_usuario: UsuarioORM,
+        veterinario_usuario: UsuarioORM
+    ):
+        """Test batch lookup by username returns a dict keyed by username."""
+        usuarios = usuario_repository.get_by_usernames([
+            cliente_usuario.username,
+            veterinario_usuario.username,
+            "nonexistent_user",
+            None,
+        ])
+        
+        assert set(usuarios) == {cliente_usuario.username, veterinario_usuario.username}
+        assert usuarios[veterinario_usuario.username].id == veterinario_usuario.id
+        assert usuario_repository.get_by_usernames([]) == {}
+    
     def test_find_by_role(
         self,
         usuario_repository: UsuarioRepository,
@@ -281,6 +299,41 @@ class TestUsuarioRepositoryUpdate:
         # Verify old username not found
         old_user = usuario_repository.find_by_username(old_username)
         assert old_user is None
+    
+    def test_update_returning(
+        self,
+        usuario_repository: UsuarioRepository,
+        cliente_usuario: UsuarioORM
+    ):
+        """Test single-statement update returns the updated row."""
+        updated = usuario_repository.update_returning(
+            cliente_usuario.id,
+            {"nombre": "Nombre Returning", "edad": 45},
+            user_id=cliente_usuario.id
+        )
+        usuario_repository.commit()
+        
+        assert updated is not None
+        assert updated.nombre == "Nombre Returning"
+        assert updated.edad == 45
+        assert updated.id_usuario_actualizacion == cliente_usuario.id
+        assert usuario_repository.get_by_id(cliente_usuario.id).edad == 45
+    
+    def test_update_returning_usuario_eliminado(
+        self,
+        usuario_repository: UsuarioRepository,
+        cliente_usuario: UsuarioORM
+    ):
+        """Test update_returning does not touch soft-deleted usuarios."""
+        usuario_repository.delete(cliente_usuario)
+        usuario_repository.commit()
+        
+        updated = usuario_repository.update_returning(
+            cliente_usuario.id,
+            {"nombre": "No Debe Cambiar"}
+        )
+        
+        assert updated is None
 
 
 class TestUsuarioRepositoryDelete:
@@ -441,6 +494,37 @@ class TestUsuarioRepositoryValidation:
         
         assert exists is False
     
+    def test_exists_username_with_exclusion_other_user(
+        self,
+        usuario_repository: UsuarioRepository,
+        cliente_usuario: UsuarioORM,
+        veterinario_usuario: UsuarioORM
+    ):
+        """Test exists_username still detects the username owned by another user."""
+        exists = usuario_repository.exists_username(
+            cliente_usuario.username,
+            exclude_id=veterinario_usuario.id
+        )
+        
+        assert exists is True
+    
+    def test_update_username_references(
+        self,
+        usuario_repository: UsuarioRepository,
+        db_session: Session,
+        mascota_instance: MascotaORM,
+        vacuna_instance
+    ):
+        """Test cascade rename updates propietario/veterinario references."""
+        updated = usuario_repository.update_username_references("testcliente", "clienterenombrado")
+        
+        assert updated["mascotas"] == 1
+        assert updated["vacunas"] == 0
+        assert set(updated) == {"mascotas", "citas", "vacunas", "facturas", "recetas"}
+        
+        db_session.expire_all()
+        assert db_session.get(MascotaORM, mascota_instance.id).propietario == "clienterenombrado"
+    
     def test_search_by_name(
         self,
         usuario_repository: UsuarioRepository,
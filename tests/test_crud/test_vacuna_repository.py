@@ -230,6 +230,31 @@ class TestVacunaRepositoryRead:
         page2 = repo.find_by_mascota(mascota_instance.id, skip=5, limit=5)
         assert len(page2) == 5
     
+    def test_count_by_mascota(
+        self,
+        db_session: Session,
+        mascota_instance: MascotaORM,
+        veterinario_usuario: UsuarioORM
+    ):
+        """Test counting vaccines by mascota, with and without deleted ones."""
+        repo = VacunaRepository(db_session)
+        
+        vacunas = []
+        for i in range(4):
+            vacuna_data = VacunaORM(
+                id_mascota=mascota_instance.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=i),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username
+            )
+            vacunas.append(repo.create(vacuna_data, user_id=veterinario_usuario.id))
+        repo.delete(vacunas[0], user_id=veterinario_usuario.id)
+        db_session.commit()
+        
+        assert repo.count_by_mascota(mascota_instance.id) == 3
+        assert repo.count_by_mascota(mascota_instance.id, include_deleted=True) == 4
+    
     def test_find_by_tipo_vacuna(
         self,
         db_session: Session,
@@ -384,6 +409,100 @@ class TestVacunaRepositoryRead:
         final_count = repo.count()
         
         assert final_count == initial_count + 3
+    
+    def test_find_by_multiple_filters_propietario_antes_de_paginar(
+        self,
+        db_session: Session,
+        mascota_instance: MascotaORM,
+        mascota_otro_cliente: MascotaORM,
+        veterinario_usuario: UsuarioORM
+    ):
+        """Test the propietario filter runs in SQL, before LIMIT."""
+        repo = VacunaRepository(db_session)
+        
+        # Newest vacunas belong to the other owner, so a Python-side filter
+        # applied after LIMIT would return nothing for mascota_instance
+        for i in range(6):
+            mascota = mascota_otro_cliente if i < 3 else mascota_instance
+            vacuna_data = VacunaORM(
+                id_mascota=mascota.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=i),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username
+            )
+            repo.create(vacuna_data, user_id=veterinario_usuario.id)
+        db_session.commit()
+        
+        vacunas = repo.find_by_multiple_filters(
+            propietario_username=mascota_instance.propietario,
+            limit=3
+        )
+        
+        assert len(vacunas) == 3
+        assert all(v.id_mascota == mascota_instance.id for v in vacunas)
+        assert repo.count_by_filters(
+            propietario_username=mascota_instance.propietario
+        ) == 3
+    
+    def test_find_proximas_dosis_propietario_antes_de_limitar(
+        self,
+        db_session: Session,
+        mascota_instance: MascotaORM,
+        mascota_otro_cliente: MascotaORM,
+        veterinario_usuario: UsuarioORM
+    ):
+        """Test find_proximas_dosis filters by propietario before LIMIT."""
+        repo = VacunaRepository(db_session)
+        
+        # Earliest upcoming doses belong to the other owner
+        for i in range(4):
+            mascota = mascota_otro_cliente if i < 2 else mascota_instance
+            vacuna_data = VacunaORM(
+                id_mascota=mascota.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=365),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username,
+                proxima_dosis=date.today() + timedelta(days=i + 1)
+            )
+            repo.create(vacuna_data, user_id=veterinario_usuario.id)
+        db_session.commit()
+        
+        vacunas = repo.find_proximas_dosis(
+            limit=2,
+            propietario_username=mascota_instance.propietario
+        )
+        
+        assert len(vacunas) == 2
+        assert all(v.id_mascota == mascota_instance.id for v in vacunas)
+    
+    def test_count_by_filters_capped(
+        self,
+        db_session: Session,
+        mascota_instance: MascotaORM,
+        veterinario_usuario: UsuarioORM
+    ):
+        """Test capped count stops at the cap and is exact below it."""
+        repo = VacunaRepository(db_session)
+        
+        for i in range(5):
+            vacuna_data = VacunaORM(
+                id_mascota=mascota_instance.id,
+                tipo_vacuna="rabia",
+                fecha_aplicacion=date.today() - timedelta(days=i),
+                lote_vacuna=f"LOTE{i:06d}",
+                veterinario=veterinario_usuario.username
+            )
+            repo.create(vacuna_data, user_id=veterinario_usuario.id)
+        db_session.commit()
+        
+        assert repo.count_by_filters_capped(3, id_mascota=mascota_instance.id) == 3
+        assert repo.count_by_filters_capped(100, id_mascota=mascota_instance.id) == 5
+        assert repo.count_by_filters_capped(
+            100,
+            propietario_username=mascota_instance.propietario
+        ) == repo.count_by_filters(propietario_username=mascota_instance.propietario)
 
 
 class TestVacunaRepositoryUpdate:
@@ -658,3 +777,4 @@ class TestVacunaRepositoryRelationships:
         
         assert updated.id_usuario_actualizacion == veterinario_usuario.id
         assert updated.fecha_actualizacion >= created.fecha_actualizacion
+
@@ -0,0 +1,39 @@
+"""
+Tests for the shared pytest fixtures.
+
+Tests cover:
+- db_session isolation (commits only release SAVEPOINTs)
+"""
+
+from sqlalchemy.orm import Session
+
+from database.models import UsuarioORM
+
+
+class TestDbSessionFixture:
+    """Tests for the transactional db_session fixture."""
+    
+    def test_commit_mantiene_transaccion_externa(
+        self,
+        db_session: Session,
+        cliente_usuario: UsuarioORM
+    ):
+        """Test commit() inside a test never ends the outer transaction."""
+        db_session.commit()
+        
+        assert db_session.get_bind().in_transaction()
+        assert db_session.get(UsuarioORM, cliente_usuario.id) is not None
+    
+    def test_rollback_conserva_lo_confirmado(
+        self,
+        db_session: Session,
+        cliente_usuario: UsuarioORM
+    ):
+        """Test rollback() only undoes work since the last commit()."""
+        db_session.commit()
+        cliente_usuario.nombre = "Cambio descartado"
+        db_session.flush()
+        
+        db_session.rollback()
+        
+        assert db_session.get(UsuarioORM, cliente_usuario.id).nombre == "Cliente Test"
@@ -363,3 +363,12 @@ class TestPasswordSecurity:
         # Different salts should produce different hashes
         assert salt1 != salt2
         assert hash1 != hash2
+    
+    def test_verify_password_correcto_e_incorrecto(self):
+        """Test verify_password accepts the right password only."""
+        from database.db import hash_password, verify_password
+        
+        salt, hashed = hash_password("test_password_123")
+        
+        assert verify_password(salt, hashed, "test_password_123") is True
+        assert verify_password(salt, hashed, "wrong_password") is False
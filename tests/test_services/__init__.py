@@ -0,0 +1 @@
+# Test Services Package
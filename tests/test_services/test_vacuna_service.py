@@ -0,0 +1,68 @@
+"""
+Tests for VacunaService business logic.
+
+Tests cover:
+- Memoized usuario lookups while enriching vacuna lists
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+from datetime import date, timedelta
+
+from database.models import VacunaORM, MascotaORM, UsuarioORM
+from repositories.vacuna_repository import VacunaRepository
+from repositories.mascota_repository import MascotaRepository
+from repositories.usuario_repository import UsuarioRepository
+from services.vacuna_service import VacunaService
+
+
+@pytest.fixture
+def vacuna_service(db_session: Session) -> VacunaService:
+    """VacunaService wired to the test session."""
+    return VacunaService(
+        VacunaRepository(db_session),
+        MascotaRepository(db_session),
+        UsuarioRepository(db_session)
+    )
+
+
+class TestVacunaServiceUserCache:
+    """Tests for memoized usuario lookups in VacunaService."""
+    
+    def test_get_vacunas_resuelve_usuarios_una_vez(
+        self,
+        db_session: Session,
+        vacuna_service: VacunaService,
+        mascota_instance: MascotaORM,
+        veterinario_usuario: UsuarioORM,
+        cliente_usuario: UsuarioORM,
+        mocker
+    ):
+        """Test repeated listings on one service look usuarios up once."""
+        VacunaRepository(db_session).create_many(
+            [
+                VacunaORM(
+                    id_mascota=mascota_instance.id,
+                    tipo_vacuna="rabia",
+                    fecha_aplicacion=date.today() - timedelta(days=i),
+                    veterinario=veterinario_usuario.username,
+                )
+                for i in range(3)
+            ],
+            user_id=veterinario_usuario.id
+        )
+        batch_spy = mocker.spy(vacuna_service.usuario_repo, "get_by_usernames")
+        single_spy = mocker.spy(vacuna_service.usuario_repo, "find_by_username")
+        
+        for _ in range(2):
+            vacunas, total, _ = vacuna_service.get_vacunas(veterinario_usuario)
+            assert total == 3
+            assert {v["veterinario"] for v in vacunas} == {veterinario_usuario.username}
+            assert {v["propietario_nombre"] for v in vacunas} == {cliente_usuario.nombre}
+        
+        assert batch_spy.call_count == 1
+        assert set(batch_spy.call_args.args[0]) == {
+            veterinario_usuario.username,
+            cliente_usuario.username,
+        }
+        assert single_spy.call_count == 0
@@ -0,0 +1,40 @@
+"""
+Tests for general utilities.
+
+Tests cover:
+- UUIDv7 generation (version, variant, ordering)
+- Stored enum normalization
+"""
+
+from uuid import UUID
+
+from core.utils import normalize_stored_enum, uuid7
+
+
+class TestUuid7:
+    """Tests for time-ordered UUID generation."""
+    
+    def test_uuid7_version_y_variante(self):
+        """Test generated UUID has version 7 and RFC variant."""
+        value = uuid7()
+        
+        assert isinstance(value, UUID)
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+    
+    def test_uuid7_monotonico(self):
+        """Test consecutive UUIDs are strictly increasing as strings."""
+        values = [str(uuid7()) for _ in range(1000)]
+        
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+
+class TestNormalizeStoredEnum:
+    """Tests for stored enum normalization."""
+    
+    def test_normalize_stored_enum(self):
+        """Test full enum names are shortened and other values pass through."""
+        assert normalize_stored_enum("TipoMascota.perro") == "perro"
+        assert normalize_stored_enum("perro") == "perro"
+        assert normalize_stored_enum(None) is None